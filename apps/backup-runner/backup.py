@@ -180,6 +180,29 @@ def validate_backup_config(config: dict) -> None:
         sys.exit(1)
 
 
+def wait_borg_exit(pid: int, timeout: float) -> bool:
+    """Wait for the borg process to exit.
+
+    Used from the signal handler, which usually interrupts the main thread inside
+    Popen.wait(). That call holds the Popen's waitpid lock, so Popen.poll() and
+    Popen.wait(timeout) cannot observe the exit there. psutil waits on the PID directly.
+
+    Args:
+        pid: Borg process ID
+        timeout: Max seconds to wait
+
+    Returns:
+        True if borg exited within the timeout, False if it is still running
+    """
+    try:
+        psutil.Process(pid).wait(timeout=timeout)
+        return True
+    except psutil.NoSuchProcess:
+        return True
+    except psutil.TimeoutExpired:
+        return False
+
+
 def handle_shutdown(signum, frame):
     """Signal handler for graceful shutdown.
 
@@ -206,21 +229,21 @@ def handle_shutdown(signum, frame):
         except Exception as exc:
             logger.warning(f"Failed to send SIGINT: {exc}")
 
-        # Wait up to 10 seconds for checkpoint
+        # Wait up to 10 seconds for checkpoint, returning as soon as borg exits
         logger.info("Waiting up to 10 seconds for checkpoint to complete...")
-        for i in range(1, 11):
-            if _borg_process.poll() is not None:
-                logger.info(f"Borg stopped gracefully after {i}s")
-                break
-            time.sleep(1)
+        start = time.monotonic()
+        if wait_borg_exit(_borg_process.pid, timeout=10):
+            logger.info(f"Borg stopped gracefully after {time.monotonic() - start:.1f}s")
 
         # Still running after 10s - force kill and cleanup
-        if _borg_process.poll() is None:
+        else:
             logger.info("Checkpoint not complete after 10s, forcing termination...")
             try:
                 _borg_process.kill()
-                _borg_process.wait(timeout=1)
-                logger.info("Borg killed with SIGKILL")
+                if wait_borg_exit(_borg_process.pid, timeout=1):
+                    logger.info("Borg killed with SIGKILL")
+                else:
+                    logger.warning("Borg still running 1s after SIGKILL")
             except Exception as exc:
                 logger.warning(f"Failed to kill borg: {exc}")
 
@@ -387,6 +410,7 @@ def run_backup(config: dict) -> int:
     lock_wait = config['lockWait']
     retention = config.get('retention', {})
     cache_the_cache = config.get('cacheTheCache', False)
+    prune_list = config.get('pruneList', True)
     borg_flags = config.get('borgFlags', ['--stats'])
 
     _borg_repo = borg_repo
@@ -514,7 +538,10 @@ def run_backup(config: dict) -> int:
         logger.info(f"Retention: {retention}")
 
         # Build prune command
-        prune_cmd = ['borg', 'prune', '--lock-wait', str(lock_wait), '-v', '--list']
+        prune_cmd = ['borg', 'prune', '--lock-wait', str(lock_wait), '-v']
+        # Per-archive keep/prune lines; large repos can turn them off to keep pod logs small
+        if prune_list:
+            prune_cmd.append('--list')
 
         if retention.get('hourly'):
             prune_cmd.extend(['--keep-hourly', str(retention['hourly'])])
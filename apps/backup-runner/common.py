@@ -24,6 +24,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# LibYAML parser when PyYAML was built with it, pure-Python SafeLoader otherwise
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def load_config(config_path: str = '/config/config.yaml') -> dict:
     """Load and validate configuration from YAML file.
@@ -45,7 +48,7 @@ def load_config(config_path: str = '/config/config.yaml') -> dict:
 
     try:
         with path.open('r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
     except Exception as exc:
         logger.error(f"Failed to parse config file: {exc}")
         sys.exit(1)
@@ -79,12 +82,16 @@ def setup_ssh_key(ssh_key_content: str) -> str:
         # Create .ssh directory
         ssh_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
 
-        # Write SSH key
-        ssh_key_file.write_text(ssh_key_content, encoding='utf-8')
-        ssh_key_file.chmod(0o600)
+        # Write SSH key, created with 0600 so it is never readable by others
+        key_bytes = ssh_key_content.encode('utf-8')
+        fd = os.open(ssh_key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, key_bytes)
+        finally:
+            os.close(fd)
 
         logger.info(f"SSH key written to {ssh_key_file}")
-        logger.info(f"SSH key file size: {ssh_key_file.stat().st_size} bytes")
+        logger.info(f"SSH key file size: {len(key_bytes)} bytes")
 
         return str(ssh_key_file)
 
@@ -1,11 +1,13 @@
 """Retry wrapper for transient Kubernetes API failures.
 
 Handles etcd timeouts (HTTP 500), gateway errors (502/503/504),
-connection failures, and 409 Conflict (idempotent create).
+API Priority and Fairness throttling (429), connection failures,
+and 409 Conflict (idempotent create).
 """
 
 from __future__ import annotations
 
+import random
 import time
 from collections.abc import Callable
 
@@ -13,13 +15,18 @@ from kubernetes.client.rest import ApiException
 
 from common.pod_monitor import log_msg
 
-# HTTP status codes that indicate transient server-side failures
-TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+# HTTP status codes that indicate transient server-side failures.
+# 429 is rejected by API Priority and Fairness before the request is processed, so retrying creates is safe.
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
 
 # Retry schedule: (attempt_number, delay_seconds)
 RETRY_DELAYS = [5, 10, 20]
 MAX_ATTEMPTS = len(RETRY_DELAYS) + 1  # 4 total: 1 initial + 3 retries
 
+# Each delay is spread by +/- this fraction, so parallel callers that failed together
+# (e.g. Phase 1 clone creation during an etcd hiccup) do not all retry at the same instant
+RETRY_JITTER = 0.3
+
 
 def _is_transient_exception(exc: Exception) -> bool:
     """Check if an exception represents a transient failure worth retrying.
@@ -49,6 +56,23 @@ def _is_transient_exception(exc: Exception) -> bool:
     return False
 
 
+def _retry_after(exc: Exception) -> float | None:
+    """Return the Retry-After delay in seconds from a throttled API response, if given.
+
+    Args:
+        exc: The exception to evaluate
+
+    Returns:
+        Seconds to wait as requested by the apiserver, or None if not present
+    """
+    if not isinstance(exc, ApiException) or exc.status != 429 or not exc.headers:
+        return None
+    try:
+        return max(0.0, float(exc.headers.get("Retry-After", "")))
+    except ValueError:
+        return None
+
+
 def _is_conflict(exc: Exception) -> bool:
     """Check if exception is a 409 Conflict (resource already exists)."""
     return isinstance(exc, ApiException) and exc.status == 409
@@ -105,10 +129,15 @@ def k8s_api_retry[T](
                 )
                 raise
 
-            delay = RETRY_DELAYS[attempt - 1]
+            retry_after = _retry_after(exc)
+            if retry_after is not None:
+                # Honor the apiserver's hint; jitter only upwards so no caller retries early
+                delay = retry_after * random.uniform(1, 1 + RETRY_JITTER)
+            else:
+                delay = RETRY_DELAYS[attempt - 1] * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
             log_msg(
                 f"[k8s-retry] {context}: attempt {attempt}/{MAX_ATTEMPTS} "
-                f"failed (transient), retrying in {delay}s: {exc}"
+                f"failed (transient), retrying in {delay:.1f}s: {exc}"
             )
             time.sleep(delay)
 
@@ -6,10 +6,13 @@ Provides background thread-based monitoring of Kubernetes pods with:
 - Graceful shutdown via threading.Event
 """
 
+import codecs
+import sys
 import threading
 import time
 from kubernetes import client, watch
 from kubernetes.client.exceptions import ApiException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
 
 def log_msg(msg: str) -> None:
@@ -82,33 +85,9 @@ class PodMonitor:
         Copied from controller stream_pod_logs() function.
         """
         try:
-            # Poll until container is ready OR stop_event is set
+            # Wait until container is ready OR stop_event is set
             # No hardcoded timeout - main thread sets stop_event when pod completes
-            while not self.stop_event.is_set():
-                try:
-                    pod = self.v1.read_namespaced_pod(self.pod_name, self.namespace)
-
-                    # Check container status (not just pod phase)
-                    if pod.status.container_statuses:
-                        for container in pod.status.container_statuses:
-                            # Container running - ready to stream!
-                            if container.state.running and container.state.running.started_at:
-                                break
-
-                            # Container terminated (succeeded/failed) - need fallback
-                            if container.state.terminated:
-                                break
-                        else:
-                            # No container ready yet, keep polling
-                            time.sleep(2)
-                            continue
-
-                        # Found container in ready state, break outer loop
-                        break
-                except ApiException:
-                    pass
-
-                time.sleep(2)
+            self._wait_container_started()
 
             # If stop_event was set before container ready, exit
             if self.stop_event.is_set():
@@ -123,17 +102,28 @@ class PodMonitor:
                     _preload_content=False
                 )
 
-                # Stream logs line by line
-                for line in log_stream:
+                # Stream logs chunk by chunk: one decode, split and write per HTTP chunk instead of per line.
+                # Incremental decoder keeps multi-byte characters split across chunks intact.
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                prefix = f"[{self.pod_name}] "
+                pending = ""
+                for chunk in log_stream.stream(65536):
                     if self.stop_event.is_set():
                         break
-                    line_str = line.decode('utf-8').rstrip('\n\r')
-                    if line_str:
-                        print(f"[{self.pod_name}] {line_str}", flush=True)
+                    *lines, pending = (pending + decoder.decode(chunk)).split('\n')
+                    output = "".join(f"{prefix}{line}\n" for line in lines if line.rstrip('\r'))
+                    if output:
+                        sys.stdout.write(output.replace('\r\n', '\n'))
+                        sys.stdout.flush()
+
+                # Last line without trailing newline
+                pending = (pending + decoder.decode(b'', final=True)).rstrip('\r')
+                if pending and not self.stop_event.is_set():
+                    print(f"{prefix}{pending}", flush=True)
 
             except ApiException as exc:
                 # Handle "Bad Request" - likely pod completed before streaming started
-                if hasattr(exc, 'status') and exc.status == 400:
+                if exc.status == 400:
                     # Fallback: Read all logs without follow
                     try:
                         logs = self.v1.read_namespaced_pod_log(self.pod_name, self.namespace)
@@ -148,12 +138,54 @@ class PodMonitor:
                 else:
                     # Other error - log it
                     if not self.stop_event.is_set():
-                        reason = exc.reason if hasattr(exc, 'reason') else exc
+                        reason = exc.reason or exc
                         log_msg(f"⚠️  Log streaming ended for {self.pod_name}: {reason}")
 
         except Exception as exc:
             log_msg(f"⚠️  Error streaming logs for {self.pod_name}: {exc}")
 
+    def _wait_container_started(self) -> None:
+        """Block until a container is running or terminated, or stop_event is set.
+
+        Watches the pod instead of polling it, so log streaming starts as soon as the
+        container does. Short watch windows keep stop_event responsive.
+        """
+        resource_version = None
+        while not self.stop_event.is_set():
+            w = watch.Watch()
+            try:
+                # First window lists current state, later windows resume from the last seen version
+                kwargs = {"resource_version": resource_version} if resource_version else {}
+                for event in w.stream(
+                    self.v1.list_namespaced_pod,
+                    namespace=self.namespace,
+                    field_selector=f"metadata.name={self.pod_name}",
+                    timeout_seconds=5,
+                    **kwargs
+                ):
+                    if self.stop_event.is_set():
+                        return
+
+                    # Check container status (not just pod phase)
+                    pod = event['object']
+                    resource_version = pod.metadata.resource_version
+                    for container in (pod.status.container_statuses or []) if pod.status else []:
+                        # Container running - ready to stream!
+                        if container.state.running and container.state.running.started_at:
+                            return
+
+                        # Container terminated (succeeded/failed) - need fallback
+                        if container.state.terminated:
+                            return
+
+            except (ApiException, Urllib3HTTPError, OSError):
+                # Watch errors (410, network) - brief pause, then re-list current state
+                resource_version = None
+                time.sleep(2)
+
+            finally:
+                w.stop()
+
     def _stream_events(self) -> None:
         """Stream pod events to stdout in real-time (runs in background thread).
 
@@ -199,8 +231,8 @@ class PodMonitor:
                     # Just log and reconnect - deduplication handles replayed events
                     if not self.stop_event.is_set():
                         # Only log non-timeout errors
-                        if not (hasattr(exc, 'status') and exc.status == 410):
-                            reason = exc.reason if hasattr(exc, 'reason') else exc
+                        if exc.status != 410:
+                            reason = exc.reason or exc
                             log_msg(f"⚠️  Event watch interrupted for {self.pod_name}: {reason}")
                     # Continue to reconnect (outer while loop)
 
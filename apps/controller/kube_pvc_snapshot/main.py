@@ -39,9 +39,10 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from kubernetes import client, config as k8s_config
+from kubernetes import client, config as k8s_config, watch
 from kubernetes.client.rest import ApiException
 from kubernetes.config.config_exception import ConfigException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
 from common.hooks import execute_hooks
 from common.k8s_retry import k8s_api_retry
@@ -50,6 +51,19 @@ GROUP = "snapshot.storage.k8s.io"
 VERSION = "v1"
 PLURAL = "volumesnapshots"
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# HTTP connections kept by the shared ApiClient (the client default scales with CPU count)
+CONNECTION_POOL_MAXSIZE = 32
+
+# (connect, read) seconds for one-shot API requests, so a hung apiserver fails the
+# snapshot instead of stalling the job. The readiness watch sets its own timeout.
+API_REQUEST_TIMEOUT = (3.0, 30.0)
+
+# Transport failures on watch connections (connection resets, idle timeouts); the watch resumes
+WATCH_TRANSPORT_ERRORS = (Urllib3HTTPError, OSError)
+
 # Global state for signal handler
 _config: dict[str, Any] | None = None
 _namespace: str | None = None
@@ -82,7 +96,7 @@ def load_config(cli_path: str | None) -> dict[str, Any]:
     path = resolve_config_path(cli_path)
     try:
         with path.open("r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=YAML_LOADER)
     except FileNotFoundError:
         print(f"❌ Config file not found: {path}", file=sys.stderr)
         sys.exit(2)
@@ -105,7 +119,13 @@ def init_clients() -> tuple[client.CustomObjectsApi, client.ApiClient]:
         except Exception as exc:
             print(f"❌ Failed to load kubeconfig: {exc}", file=sys.stderr)
             sys.exit(3)
-    return client.CustomObjectsApi(), client.ApiClient()
+
+    # One ApiClient (and urllib3 connection pool) shared by snapshot calls and hooks, sized
+    # for one snapshot worker per PVC so parallel creates reuse kept-alive connections
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+    api_client = client.ApiClient(configuration)
+    return client.CustomObjectsApi(api_client), api_client
 
 
 def transform_hooks_to_common_format(hooks: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -161,11 +181,11 @@ def create_snapshot(
 
     k8s_api_retry(
         operation=lambda: api.create_namespaced_custom_object(
-            GROUP, VERSION, namespace, PLURAL, body
+            GROUP, VERSION, namespace, PLURAL, body, _request_timeout=API_REQUEST_TIMEOUT
         ),
         context=f"creating snapshot {snap_name} for PVC {pvc_name}",
         on_conflict=lambda: api.get_namespaced_custom_object(
-            GROUP, VERSION, namespace, PLURAL, snap_name
+            GROUP, VERSION, namespace, PLURAL, snap_name, _request_timeout=API_REQUEST_TIMEOUT
         ),
     )
     return snap_name
@@ -189,11 +209,58 @@ def wait_snapshot_ready(
         TimeoutError: If snapshot not ready within timeout
     """
     end = time.time() + timeout
-    while time.time() < end:
-        snap = api.get_namespaced_custom_object(GROUP, VERSION, namespace, PLURAL, name)
-        if snap.get("status", {}).get("readyToUse"):
-            return
-        time.sleep(2)
+    # Read once (snapshots of small volumes are often ready already), then watch the
+    # snapshot from that resourceVersion so readyToUse is seen as soon as it flips
+    snap = api.get_namespaced_custom_object(
+        GROUP, VERSION, namespace, PLURAL, name, _request_timeout=API_REQUEST_TIMEOUT
+    )
+    if snap.get("status", {}).get("readyToUse"):
+        return
+    resource_version = snap.get("metadata", {}).get("resourceVersion")
+
+    use_watch = True
+    w = watch.Watch()
+    try:
+        while (remaining := int(end - time.time())) > 0:
+            if not use_watch:
+                # Watch not available - poll the snapshot directly
+                time.sleep(2)
+                try:
+                    snap = api.get_namespaced_custom_object(
+                        GROUP, VERSION, namespace, PLURAL, name, _request_timeout=API_REQUEST_TIMEOUT
+                    )
+                except WATCH_TRANSPORT_ERRORS:
+                    continue
+                if snap.get("status", {}).get("readyToUse"):
+                    return
+                continue
+
+            try:
+                kwargs = {"resource_version": resource_version} if resource_version else {}
+                for event in w.stream(
+                    api.list_namespaced_custom_object,
+                    GROUP, VERSION, namespace, PLURAL,
+                    field_selector=f"metadata.name={name}",
+                    timeout_seconds=remaining,
+                    **kwargs
+                ):
+                    obj = event["object"]
+                    resource_version = obj.get("metadata", {}).get("resourceVersion")
+                    if obj.get("status", {}).get("readyToUse"):
+                        return
+            except ApiException as exc:
+                if exc.status == 410:
+                    # Resource version expired - re-list current state
+                    resource_version = None
+                    continue
+                # Watch not permitted or failing - fall back to polling reads
+                print(f"⚠️  Snapshot watch for {name} failed ({exc.status}) - polling instead", file=sys.stderr)
+                use_watch = False
+            except WATCH_TRANSPORT_ERRORS:
+                # Connection dropped - brief pause, then resume from the last seen version
+                time.sleep(2)
+    finally:
+        w.stop()
     raise TimeoutError(f"Snapshot {name} not ready after {timeout}s")
 
 
@@ -236,7 +303,8 @@ def prune_snapshots_tiered(
     # Fetch all snapshots for this PVC
     snaps = api.list_namespaced_custom_object(
         GROUP, VERSION, namespace, PLURAL,
-        label_selector=f"pvc={pvc_name}"
+        label_selector=f"pvc={pvc_name}",
+        _request_timeout=API_REQUEST_TIMEOUT
     )
     items = snaps.get("items", [])
 
@@ -7,7 +7,8 @@ This module orchestrates the BorgBackup process:
 
 The controller uses an optimized two-phase approach:
 - Phase 1: Start ALL clone PVC creation in parallel (non-blocking)
-- Phase 2: Process backups SEQUENTIALLY, waiting for each clone individually
+- Phase 2: Process backups SEQUENTIALLY, taking whichever clone is Bound first
+  (one shared watch over the run's clones), waiting for each clone individually
 
 This maximizes parallelism - while backup N runs, clones N+1, N+2, etc. continue
 provisioning in the background. First backup starts as soon as first clone is ready.
@@ -16,20 +17,29 @@ provisioning in the background. First backup starts as soon as first clone is re
 from __future__ import annotations
 
 import argparse
+import contextlib
 import os
+import queue
+import random
+import re
 import signal
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait as wait_futures
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import yaml
-from kubernetes import client, config as k8s_config
+from kubernetes import client, config as k8s_config, watch
 from kubernetes.client.rest import ApiException
 from kubernetes.config.config_exception import ConfigException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
 from common.k8s_retry import k8s_api_retry
 from common.pod_monitor import PodMonitor
@@ -38,12 +48,128 @@ SNAP_GROUP = "snapshot.storage.k8s.io"
 SNAP_VERSION = "v1"
 SNAP_PLURAL = "volumesnapshots"
 
-# Global state for SIGTERM handler
-_tracked_resources: dict[str, list[str]] = {"clone_pvcs": [], "borg_pods": [], "ssh_secrets": []}
+# Longhorn volume CRD (Longhorn always installs to longhorn-system)
+LONGHORN_GROUP = "longhorn.io"
+LONGHORN_VERSION = "v1beta2"
+LONGHORN_NAMESPACE = "longhorn-system"
+LONGHORN_PLURAL = "volumes"
+# Default seconds to wait after a Longhorn clone is attached+healthy before the borg pod mounts it
+# (CSI may still reject the attach with "volume is not ready for workloads"); per backup: longhornGracePeriod
+LONGHORN_GRACE_PERIOD = 15
+
+# Adaptive polling: start fast, back off geometrically up to a per-loop cap
+POLL_INITIAL_DELAY = 0.25
+POLL_BACKOFF = 1.5
+POLL_JITTER = 0.3  # Each sleep is spread by +/- this fraction so parallel waiters do not poll in lockstep
+
+# LibYAML emitter/parser when PyYAML was built with it, pure-Python safe variants otherwise
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Event messages that indicate a clone PVC failed to provision
+PVC_EVENT_ERROR_PATTERN = re.compile(r"provisioningfailed|not found|failed|error|cannot|unable", re.IGNORECASE)
+
+# Delete options: never block on dependents. Secrets and PVCs have nothing to shut down,
+# pods keep their grace period so backup-runner can checkpoint and release borg locks on SIGTERM.
+POD_DELETE_OPTIONS = client.V1DeleteOptions(propagation_policy="Background")
+IMMEDIATE_DELETE_OPTIONS = client.V1DeleteOptions(propagation_policy="Background", grace_period_seconds=0)
+
+# Upper bound on concurrent clone PVC creations in Phase 1
+MAX_CLONE_WORKERS = 32
+
+# HTTP connections kept by the shared ApiClient (clone workers + watches + headroom)
+CONNECTION_POOL_MAXSIZE = 2 * MAX_CLONE_WORKERS
+
+# Transport-level retries for transient apiserver errors (429 honors Retry-After).
+# urllib3 only retries idempotent methods on these statuses; creates (POST) keep k8s_api_retry,
+# which retries 429/5xx (honoring Retry-After) and handles 409 on a retried create.
+# After the last retry the response surfaces as ApiException.
+# Read timeouts are not retried, so API_REQUEST_TIMEOUT bounds a hung call instead of multiplying it.
+API_RETRIES = Retry(
+    total=5,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False
+)
+
+# (connect, read) seconds for one-shot API requests, so a hung apiserver fails the
+# affected backup instead of stalling the run. Watches and log streams set their own.
+API_REQUEST_TIMEOUT = (3.0, 30.0)
+
+# Transport failures on long-lived watch connections (connection resets, LB idle timeouts,
+# read timeouts). The watched object is unaffected, so watches reconnect instead of failing.
+WATCH_TRANSPORT_ERRORS = (Urllib3HTTPError, OSError)
+
+# Seconds per window of the long-lived PVC event watch. Each window also gets a client-side read
+# timeout slightly above it, so a half-open connection (idle LB/NAT drop) ends instead of blocking.
+PVC_EVENT_WATCH_WINDOW = 300
+
+# Seconds Phase 2 waits for some clone to report Bound before taking the oldest one anyway
+# (WaitForFirstConsumer clones only bind once the borg pod mounts them)
+READY_CLONE_WAIT = 10
+
+# Seconds the SIGTERM handler waits for in-flight clone creates before deleting the run's resources.
+# Bounded because a worker may block on _state_lock held by the interrupted main thread; its create
+# has already landed by then and is removed by the label-selected delete.
+CLONE_SHUTDOWN_TIMEOUT = 10
+
+# Label carried by every resource created in one controller run, for label-selected cleanup
+RUN_UID_LABEL = "borg-run-uid"
+# Label shared by the clone PVC, config secret and borg pod of a single backup
+BACKUP_JOB_LABEL = "borg-backup-job"
+
+# Borg container mounts; identical for every backup, so built once and shared by all pod manifests
+BORG_VOLUME_MOUNTS: list[dict[str, Any]] = [
+    {
+        "name": "config",
+        "mountPath": "/config",
+        "readOnly": True
+    },
+    {
+        "name": "data",
+        "mountPath": "/data",
+        "readOnly": True
+    },
+    {
+        "name": "cache",
+        "mountPath": "/cache"
+    }
+]
+
+# Global state for SIGTERM handler (backup results are returned, not kept here)
+# Mutated from Phase 1 worker threads and the signal handler, so all access goes through _state_lock.
+# RLock because the SIGTERM handler runs on the main thread and may interrupt a holder of the lock.
+_tracked_resources: dict[str, set[str]] = {"clone_pvcs": set(), "borg_pods": set(), "ssh_secrets": set()}
 _namespace: str | None = None
 _core_api: client.CoreV1Api | None = None
 _storage_api: client.StorageV1Api | None = None
-_failures: list[str] = []
+_custom_api: client.CustomObjectsApi | None = None
+_run_uid: str = uuid.uuid4().hex[:8]
+_state_lock = threading.RLock()
+
+# Storage class validation results, keyed by class name (classes do not change during a run)
+_storage_class_cache: dict[str, tuple[bool, str]] = {}
+_storage_classes_preloaded = False  # Cache holds every class in the cluster; misses mean "not found"
+
+# VolumeSnapshots of the namespace keyed by their pvc label, from one LIST before Phase 1
+_snapshots_by_pvc: dict[str, list[dict[str, Any]]] = {}
+_snapshots_preloaded = False  # Index holds every labeled snapshot; misses mean "no snapshot"
+
+# PVC events keyed by PVC name, then event UID; fed by the watch_pvc_events thread
+_pvc_events: dict[str, dict[str, Any]] = {}
+_pvc_events_synced = threading.Event()
+
+# Phases of this run's clone PVCs by name; fed by the watch_clone_pvcs thread
+_clone_pvc_phases: dict[str, str] = {}
+_clone_pvcs_changed = threading.Condition(_state_lock)
+
+# Per-backup cleanup deletes (one per kind), reused across all backups of the run
+_cleanup_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="cleanup")
+
+# Phase 1 clone creation, kept so the SIGTERM handler can stop it before deleting the run's resources
+_clone_executor: ThreadPoolExecutor | None = None
+_clone_futures: list[Future[ClonePVC]] = []
 
 
 @dataclass
@@ -56,11 +182,33 @@ class ClonePVC:
     backup_config: dict[str, Any]
     failed: bool = False
     failure_reason: str | None = None
+    # Set for ephemeral backups: clone PVC spec mounted as a pod-owned generic ephemeral volume
+    ephemeral_spec: dict[str, Any] | None = None
+    # Value of BACKUP_JOB_LABEL on every resource of this backup
+    job_id: str = ""
 
 
 def log_msg(msg: str) -> None:
     """Log message to stdout with consistent formatting."""
-    print(msg)
+    print(msg, flush=True)
+
+
+def track_resource(kind: str, name: str) -> None:
+    """Register a created resource for SIGTERM cleanup."""
+    with _state_lock:
+        _tracked_resources[kind].add(name)
+
+
+def untrack_resource(kind: str, name: str) -> None:
+    """Forget a resource after it has been deleted."""
+    with _state_lock:
+        _tracked_resources[kind].discard(name)
+
+
+def tracked_snapshot(kind: str) -> list[str]:
+    """Return a copy of tracked resource names (safe to iterate while others mutate)."""
+    with _state_lock:
+        return list(_tracked_resources[kind])
 
 
 def parse_args() -> argparse.Namespace:
@@ -68,6 +216,10 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run borg backups from PVC snapshots")
     parser.add_argument("-c", "--config", help="Path to config file")
     parser.add_argument("--test", action="store_true", help="Test mode: skip borg pod spawn")
+    parser.add_argument(
+        "--test-simulate-latency", type=float, default=0.0, metavar="SECONDS",
+        help="Test mode: simulated duration of each backup (default: 0)"
+    )
     return parser.parse_args()
 
 
@@ -86,7 +238,7 @@ def load_config(cli_path: str | None) -> dict[str, Any]:
     path = resolve_config_path(cli_path)
     try:
         with path.open("r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=YAML_LOADER)
     except FileNotFoundError:
         log_msg(f"❌ Config file not found: {path}")
         sys.exit(2)
@@ -96,9 +248,51 @@ def load_config(cli_path: str | None) -> dict[str, Any]:
     if not isinstance(data, dict):
         log_msg("❌ Config root must be a mapping")
         sys.exit(2)
+    error = config_type_error(data)
+    if error:
+        log_msg(f"❌ Invalid config {path}: {error}")
+        sys.exit(2)
     return data
 
 
+def config_type_error(data: dict[str, Any]) -> str | None:
+    """Check the types of all config fields once, so the backup loop can rely on them.
+
+    Missing fields are not reported here; required-field checks stay with their users.
+
+    Args:
+        data: Parsed config mapping
+
+    Returns:
+        Description of the first wrongly typed field, or None if all types are valid
+    """
+    def wrong(value: Any, expected: type | tuple[type, ...]) -> bool:
+        # bool is an int subclass, but "timeout: true" is still a config error
+        return value is not None and (isinstance(value, bool) or not isinstance(value, expected))
+
+    for key in ("releaseName", "borgRepo", "borgPassphrase", "sshPrivateKey", "cachePVC"):
+        if wrong(data.get(key), str):
+            return f"'{key}' must be a string"
+    if data.get("pruneList") is not None and not isinstance(data.get("pruneList"), bool):
+        return "'pruneList' must be a boolean"
+    if wrong(data.get("backups"), list):
+        return "'backups' must be a list"
+
+    for index, backup in enumerate(data.get("backups") or []):
+        if not isinstance(backup, dict):
+            return f"backups[{index}] must be a mapping"
+        for key in ("name", "pvc", "class"):
+            if wrong(backup.get(key), str):
+                return f"backups[{index}].{key} must be a string"
+        for key in ("timeout", "cloneBindTimeout", "longhornGracePeriod"):
+            if wrong(backup.get(key), int):
+                return f"backups[{index}].{key} must be an integer"
+        if wrong(backup.get("borgFlags"), list):
+            return f"backups[{index}].borgFlags must be a list"
+
+    return None
+
+
 def init_clients() -> tuple[client.CoreV1Api, client.CustomObjectsApi, client.StorageV1Api]:
     """Initialize Kubernetes API clients."""
     try:
@@ -109,7 +303,15 @@ def init_clients() -> tuple[client.CoreV1Api, client.CustomObjectsApi, client.St
         except Exception as exc:
             log_msg(f"❌ Failed to load kubeconfig: {exc}")
             sys.exit(3)
-    return client.CoreV1Api(), client.CustomObjectsApi(), client.StorageV1Api()
+
+    # One ApiClient (and urllib3 connection pool) shared by all API groups.
+    # Sized for the Phase 1 clone workers plus the long-lived watch and monitor connections,
+    # so concurrent requests reuse kept-alive connections instead of opening and discarding them.
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+    configuration.retries = API_RETRIES
+    api_client = client.ApiClient(configuration)
+    return client.CoreV1Api(api_client), client.CustomObjectsApi(api_client), client.StorageV1Api(api_client)
 
 
 def cleanup_all_resources() -> None:
@@ -119,29 +321,56 @@ def cleanup_all_resources() -> None:
 
     log_msg("\n\n🛑 Received SIGTERM - cleaning up all tracked resources...")
 
-    # Clean up config secrets
-    for secret_name in _tracked_resources["ssh_secrets"]:
+    # One label-selected delete per kind instead of one request per resource.
+    # Kinds are deleted concurrently: PVC protection keeps a clone until its pod is gone anyway.
+    selector = f"{RUN_UID_LABEL}={_run_uid}"
+
+    # Stop Phase 1 first, so no clone PVC is created after the collection delete
+    clones_in_flight = False
+    if _clone_executor is not None:
+        _clone_executor.shutdown(wait=False, cancel_futures=True)
+        clones_in_flight = bool(wait_futures(_clone_futures, timeout=CLONE_SHUTDOWN_TIMEOUT).not_done)
+
+    cleanup_plan = [
+        ("ssh_secrets", "config secret", IMMEDIATE_DELETE_OPTIONS,
+         _core_api.delete_collection_namespaced_secret, _core_api.delete_namespaced_secret),
+        ("borg_pods", "borg pod", POD_DELETE_OPTIONS,
+         _core_api.delete_collection_namespaced_pod, _core_api.delete_namespaced_pod),
+        ("clone_pvcs", "clone PVC", IMMEDIATE_DELETE_OPTIONS,
+         _core_api.delete_collection_namespaced_persistent_volume_claim,
+         _core_api.delete_namespaced_persistent_volume_claim),
+    ]
+
+    def delete_one(label: str, options: client.V1DeleteOptions, delete: Any, name: str) -> None:
         try:
-            log_msg(f"🗑️  Deleting config secret: {secret_name}")
-            _core_api.delete_namespaced_secret(secret_name, _namespace)
+            log_msg(f"🗑️  Deleting {label}: {name}")
+            delete(name, _namespace, body=options)
         except ApiException as exc:
-            log_msg(f"⚠️  Failed to delete secret {secret_name}: {exc}")
-
-    # Clean up borg pods
-    for pod_name in _tracked_resources["borg_pods"]:
+            log_msg(f"⚠️  Failed to delete {label} {name}: {exc}")
+
+    # Snapshot the tracked names here, on the handler thread: it may have interrupted a holder of
+    # _state_lock, which is reentrant for this thread only, so pool workers must not take the lock
+    tracked = {kind: tracked_snapshot(kind) for kind, *_ in cleanup_plan}
+
+    def delete_kind(
+        kind: str, label: str, options: client.V1DeleteOptions, delete_collection: Any, delete: Any
+    ) -> list[tuple[str, client.V1DeleteOptions, Any, str]]:
+        """Batch-delete one kind; return per-name deletes still needed if the batch call fails."""
+        names = tracked[kind]
+        # A create still in flight may not be tracked yet, but its PVC carries the run label
+        if not names and not (kind == "clone_pvcs" and clones_in_flight):
+            return []
         try:
-            log_msg(f"🗑️  Deleting borg pod: {pod_name}")
-            _core_api.delete_namespaced_pod(pod_name, _namespace)
+            log_msg(f"🗑️  Deleting {len(names)} {label}(s) with {selector}")
+            delete_collection(_namespace, label_selector=selector, body=options)
+            return []
         except ApiException as exc:
-            log_msg(f"⚠️  Failed to delete pod {pod_name}: {exc}")
+            log_msg(f"⚠️  Batch delete of {label}s failed ({exc.status}) - deleting individually")
+            return [(label, options, delete, name) for name in names]
 
-    # Clean up clone PVCs
-    for pvc_name in _tracked_resources["clone_pvcs"]:
-        try:
-            log_msg(f"🗑️  Deleting clone PVC: {pvc_name}")
-            _core_api.delete_namespaced_persistent_volume_claim(pvc_name, _namespace)
-        except ApiException as exc:
-            log_msg(f"⚠️  Failed to delete PVC {pvc_name}: {exc}")
+    with ThreadPoolExecutor(max_workers=MAX_CLONE_WORKERS) as executor:
+        fallbacks = [task for tasks in executor.map(lambda plan: delete_kind(*plan), cleanup_plan) for task in tasks]
+        list(executor.map(lambda task: delete_one(*task), fallbacks))
 
     log_msg("✅ Cleanup complete")
     sys.exit(143)  # Standard exit code for SIGTERM
@@ -157,17 +386,58 @@ def validate_storage_class(storage_api: client.StorageV1Api, storage_class: str)
     Returns:
         Tuple of (exists: bool, error_message: str or empty)
     """
+    with _state_lock:
+        cached = _storage_class_cache.get(storage_class)
+    if cached is not None:
+        return cached
+    if _storage_classes_preloaded:
+        return False, f"Storage class '{storage_class}' not found"
+
     try:
-        storage_api.read_storage_class(storage_class)
-        return True, ""
+        # resource_version="0" is served from the apiserver watch cache instead of etcd.
+        # A slightly stale answer is fine: a class deleted since would still fail clone provisioning.
+        classes = storage_api.list_storage_class(
+            field_selector=f"metadata.name={storage_class}",
+            resource_version="0",
+            _request_timeout=API_REQUEST_TIMEOUT
+        )
+        result = (True, "") if classes.items else (False, f"Storage class '{storage_class}' not found")
+        # Only definitive answers are cached; API errors are retried by the next backup
+        with _state_lock:
+            _storage_class_cache[storage_class] = result
+        return result
     except ApiException as exc:
-        if exc.status == 404:
-            return False, f"Storage class '{storage_class}' not found"
         return False, f"Failed to validate storage class '{storage_class}': {exc}"
     except Exception as exc:
         return False, f"Unexpected error validating storage class '{storage_class}': {exc}"
 
 
+def preload_storage_classes(storage_api: client.StorageV1Api) -> None:
+    """Fill the storage class cache with a single LIST of all classes.
+
+    On failure the cache is left empty and validate_storage_class looks classes up one by one.
+
+    Args:
+        storage_api: StorageV1Api client
+    """
+    global _storage_classes_preloaded
+
+    try:
+        classes = storage_api.list_storage_class(resource_version="0", _request_timeout=API_REQUEST_TIMEOUT)
+    except ApiException as exc:
+        log_msg(f"⚠️  Could not list storage classes ({exc.status}) - validating per backup")
+        return
+    except Exception as exc:
+        # Request timeouts and connection errors surface from urllib3, not as ApiException
+        log_msg(f"⚠️  Could not list storage classes ({exc}) - validating per backup")
+        return
+
+    with _state_lock:
+        for sc in classes.items:
+            _storage_class_cache[sc.metadata.name] = (True, "")
+        _storage_classes_preloaded = True
+
+
 def is_longhorn_volume(v1: client.CoreV1Api, pvc: Any) -> bool:
     """Check if PVC is provisioned by Longhorn CSI driver.
 
@@ -184,7 +454,7 @@ def is_longhorn_volume(v1: client.CoreV1Api, pvc: Any) -> bool:
             return False
 
         # Read the bound PV
-        pv = v1.read_persistent_volume(pvc.spec.volume_name)
+        pv = v1.read_persistent_volume(pvc.spec.volume_name, _request_timeout=API_REQUEST_TIMEOUT)
 
         # Check CSI driver
         if pv.spec.csi and pv.spec.csi.driver == "driver.longhorn.io":
@@ -196,10 +466,18 @@ def is_longhorn_volume(v1: client.CoreV1Api, pvc: Any) -> bool:
         return False
 
 
-def is_longhorn_volume_ready(pv_name: str) -> bool:
+def longhorn_volume_attached_healthy(lh_volume: dict[str, Any]) -> bool:
+    """Return True if a Longhorn volume object is attached and healthy."""
+    # Extract status fields (no 'ready' field exists in v1beta2)
+    status = lh_volume.get("status") or {}
+    return status.get("state") == "attached" and status.get("robustness") == "healthy"
+
+
+def is_longhorn_volume_ready(custom_api: client.CustomObjectsApi, pv_name: str) -> bool:
     """Check if Longhorn volume is ready for workload attachment.
 
     Args:
+        custom_api: CustomObjectsApi client
         pv_name: PersistentVolume name (same as Longhorn volume name)
 
     Returns:
@@ -215,24 +493,17 @@ def is_longhorn_volume_ready(pv_name: str) -> bool:
     # actually ready for pod attachment yet. Checking the Longhorn CRD gives a reliable signal.
     # Without this check, pods fail with "volume is not ready for workloads" errors.
     try:
-        custom_api = client.CustomObjectsApi()
-
         # Query Longhorn volume CRD
         lh_volume = custom_api.get_namespaced_custom_object(
-            group="longhorn.io",
-            version="v1beta2",
-            namespace="longhorn-system",  # Longhorn convention - always installs here
-            plural="volumes",
-            name=pv_name
+            group=LONGHORN_GROUP,
+            version=LONGHORN_VERSION,
+            namespace=LONGHORN_NAMESPACE,  # Longhorn convention - always installs here
+            plural=LONGHORN_PLURAL,
+            name=pv_name,
+            _request_timeout=API_REQUEST_TIMEOUT
         )
 
-        # Extract status fields (no 'ready' field exists in v1beta2)
-        status = lh_volume.get("status", {})
-        state = status.get("state", "unknown")
-        robustness = status.get("robustness", "unknown")
-
-        # Check readiness: must be attached AND healthy
-        is_ready = (state == "attached" and robustness == "healthy")
+        is_ready = longhorn_volume_attached_healthy(lh_volume)
 
         # Only log when ready (reduces polling spam)
         if is_ready:
@@ -242,8 +513,8 @@ def is_longhorn_volume_ready(pv_name: str) -> bool:
 
     except ApiException as exc:
         # If volume doesn't exist or not accessible, log and handle appropriately
-        reason = exc.reason if hasattr(exc, 'reason') else str(exc)
-        status_code = exc.status if hasattr(exc, 'status') else 'unknown'
+        reason = exc.reason or str(exc)
+        status_code = exc.status or 'unknown'
 
         # Check for RBAC/permission errors (403 Forbidden, 401 Unauthorized)
         if status_code in [403, 401]:
@@ -252,7 +523,7 @@ def is_longhorn_volume_ready(pv_name: str) -> bool:
             log_msg("❌ Ensure ServiceAccount has ClusterRole with:")
             log_msg("   - apiGroups: ['longhorn.io']")
             log_msg("   - resources: ['volumes']")
-            log_msg("   - verbs: ['get', 'list']")
+            log_msg("   - verbs: ['get', 'list', 'watch']")
             # DO NOT proceed - this is a configuration error that needs fixing
             return False
 
@@ -266,7 +537,7 @@ def latest_snapshot(
     snap_api: client.CustomObjectsApi,
     pvc: str,
     namespace: str
-) -> str | None:
+) -> tuple[str, str] | None:
     """Find the latest ready snapshot for a PVC.
 
     Args:
@@ -275,47 +546,102 @@ def latest_snapshot(
         namespace: Kubernetes namespace
 
     Returns:
-        Snapshot name, or None if not found
+        Tuple of (snapshot name, restore size, defaulting to 1Gi), or None if not found
     """
     try:
-        snaps = snap_api.list_namespaced_custom_object(
-            SNAP_GROUP, SNAP_VERSION, namespace, SNAP_PLURAL,
-            label_selector=f"pvc={pvc}"
-        )
-        items = [s for s in snaps.get("items", []) if s.get("status", {}).get("readyToUse")]
-        items.sort(key=lambda s: s.get("metadata", {}).get("creationTimestamp", ""))
-        if not items:
+        with _state_lock:
+            items = list(_snapshots_by_pvc.get(pvc, [])) if _snapshots_preloaded else None
+        if items is None:
+            snaps = snap_api.list_namespaced_custom_object(
+                SNAP_GROUP, SNAP_VERSION, namespace, SNAP_PLURAL,
+                label_selector=f"pvc={pvc}",
+                resource_version="0",  # Served from watch cache; snapshots are taken well before backups run
+                _request_timeout=API_REQUEST_TIMEOUT
+            )
+            items = snaps.get("items", [])
+        # RFC 3339 timestamps order lexicographically, so max() finds the newest in one pass
+        ready = (s for s in items if s.get("status", {}).get("readyToUse"))
+        latest = max(ready, key=lambda s: s.get("metadata", {}).get("creationTimestamp", ""), default=None)
+        if latest is None:
             return None
-        return items[-1]["metadata"]["name"]
+        return latest["metadata"]["name"], latest["status"].get("restoreSize") or "1Gi"
     except ApiException as exc:
         log_msg(f"❌ Failed to list snapshots for {pvc}: {exc}")
         return None
 
 
+def preload_snapshots(snap_api: client.CustomObjectsApi, namespace: str) -> None:
+    """Index all VolumeSnapshots of the namespace by PVC with a single LIST.
+
+    On failure the index is left empty and latest_snapshot lists snapshots per PVC.
+
+    Args:
+        snap_api: CustomObjectsApi client
+        namespace: Kubernetes namespace
+    """
+    global _snapshots_preloaded
+
+    try:
+        snaps = snap_api.list_namespaced_custom_object(
+            SNAP_GROUP, SNAP_VERSION, namespace, SNAP_PLURAL,
+            label_selector="pvc",
+            resource_version="0",
+            _request_timeout=API_REQUEST_TIMEOUT
+        )
+    except ApiException as exc:
+        log_msg(f"⚠️  Could not list snapshots ({exc.status}) - looking them up per backup")
+        return
+    except Exception as exc:
+        # Request timeouts and connection errors surface from urllib3, not as ApiException
+        log_msg(f"⚠️  Could not list snapshots ({exc}) - looking them up per backup")
+        return
+
+    with _state_lock:
+        for snap in snaps.get("items", []):
+            _snapshots_by_pvc.setdefault(snap["metadata"]["labels"]["pvc"], []).append(snap)
+        _snapshots_preloaded = True
+
+
+def build_clone_pvc_spec(snap_name: str, storage_class: str, size: str) -> dict[str, Any]:
+    """Build the PVC spec for a clone of a VolumeSnapshot.
+
+    Shared by standalone clone PVCs and ephemeral volume claim templates.
+    """
+    return {
+        "accessModes": ["ReadWriteOncePod"],
+        "storageClassName": storage_class,
+        "resources": {"requests": {"storage": size}},
+        "dataSource": {
+            "name": snap_name,
+            "kind": "VolumeSnapshot",
+            "apiGroup": SNAP_GROUP,
+        },
+    }
+
+
 def create_clone_pvc(
     v1: client.CoreV1Api,
-    snap_api: client.CustomObjectsApi,
     snap_name: str,
+    size: str,
     clone_name: str,
     storage_class: str,
-    namespace: str
+    namespace: str,
+    job_id: str
 ) -> None:
     """Create a clone PVC from a VolumeSnapshot.
 
     Args:
         v1: CoreV1Api client
-        snap_api: CustomObjectsApi client
         snap_name: VolumeSnapshot name to clone from
+        size: Restore size of the snapshot (from latest_snapshot)
         clone_name: Name for the clone PVC
         storage_class: Storage class for the clone
         namespace: Kubernetes namespace
+        job_id: Backup job label value
 
     Raises:
         ApiException: If clone creation fails
     """
-    snap = snap_api.get_namespaced_custom_object(SNAP_GROUP, SNAP_VERSION, namespace, SNAP_PLURAL, snap_name)
-    size = snap.get("status", {}).get("restoreSize", "1Gi")
-
     body = {
         "apiVersion": "v1",
         "kind": "PersistentVolumeClaim",
@@ -324,80 +650,101 @@ def create_clone_pvc(
             "namespace": namespace,
             "labels": {
                 "app": "kube-borg-backup",
-                "managed-by": "kube-borg-backup"
+                "managed-by": "kube-borg-backup",
+                RUN_UID_LABEL: _run_uid,
+                BACKUP_JOB_LABEL: job_id
             }
         },
-        "spec": {
-            "accessModes": ["ReadWriteOncePod"],
-            "storageClassName": storage_class,
-            "resources": {"requests": {"storage": size}},
-            "dataSource": {
-                "name": snap_name,
-                "kind": "VolumeSnapshot",
-                "apiGroup": SNAP_GROUP,
-            },
-        },
+        "spec": build_clone_pvc_spec(snap_name, storage_class, size),
     }
 
     k8s_api_retry(
-        operation=lambda: v1.create_namespaced_persistent_volume_claim(namespace, body),
+        operation=lambda: v1.create_namespaced_persistent_volume_claim(
+            namespace, body, _request_timeout=API_REQUEST_TIMEOUT
+        ),
         context=f"creating clone PVC {clone_name}",
-        on_conflict=lambda: v1.read_namespaced_persistent_volume_claim(clone_name, namespace),
+        on_conflict=lambda: v1.read_namespaced_persistent_volume_claim(
+            clone_name, namespace, _request_timeout=API_REQUEST_TIMEOUT
+        ),
     )
-    _tracked_resources["clone_pvcs"].append(clone_name)
+    track_resource("clone_pvcs", clone_name)
 
 
-def create_borg_secret(
-    v1: client.CoreV1Api,
-    secret_name: str,
+def build_borg_base_config(
     borg_repo: str,
     borg_passphrase: str,
     ssh_key: str,
     retention: dict[str, int],
+    cache_the_cache: bool,
+    prune_list: bool
+) -> str:
+    """Build the part of the borg config file that is the same for every backup of a run.
+
+    Serialized once, so the SSH key and retention policy are not re-encoded per backup.
+
+    Args:
+        borg_repo: Borg repository URL
+        borg_passphrase: Borg passphrase
+        ssh_key: SSH private key content
+        retention: Retention policy (hourly, daily, weekly, monthly, yearly)
+        cache_the_cache: Enable cache-the-cache
+        prune_list: Log every archive borg prune keeps or deletes
+
+    Returns:
+        Config YAML to pass to create_borg_secret
+    """
+    config: dict[str, Any] = {
+        "borgRepo": borg_repo,
+        "borgPassphrase": borg_passphrase,
+        "sshPrivateKey": ssh_key,
+        "cacheTheCache": cache_the_cache,
+        "pruneList": prune_list,
+    }
+
+    # Add retention if specified
+    if retention:
+        config["retention"] = {
+            k: v for k, v in retention.items() if v is not None
+        }
+
+    return yaml.dump(config, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+
+
+def create_borg_secret(
+    v1: client.CoreV1Api,
+    secret_name: str,
+    base_config: str,
     backup_name: str,
     backup_dir: str,
     lock_wait: int,
-    cache_the_cache: bool,
     borg_flags: list[str],
-    namespace: str
+    namespace: str,
+    job_id: str
 ) -> None:
     """Create ephemeral secret with borg configuration file.
 
     Args:
         v1: CoreV1Api client
         secret_name: Name for the secret
-        borg_repo: Borg repository URL
-        borg_passphrase: Borg passphrase
-        ssh_key: SSH private key content
-        retention: Retention policy (hourly, daily, weekly, monthly, yearly)
+        base_config: Run-wide config YAML from build_borg_base_config
         backup_name: Backup identifier (archive prefix)
         backup_dir: Directory to backup
         lock_wait: Lock wait timeout in seconds
+        borg_flags: Borg create flags
         namespace: Kubernetes namespace
+        job_id: Backup job label value
 
     Raises:
         ApiException: If secret creation fails
     """
-    # Build config dictionary
+    # Per-backup fields appended to the run-wide YAML (block mappings concatenate)
     config = {
-        "borgRepo": borg_repo,
-        "borgPassphrase": borg_passphrase,
-        "sshPrivateKey": ssh_key,
         "prefix": backup_name,
         "backupDir": backup_dir,
         "lockWait": lock_wait,
-        "cacheTheCache": cache_the_cache,
         "borgFlags": borg_flags,
     }
-
-    # Add retention if specified
-    if retention:
-        config["retention"] = {
-            k: v for k, v in retention.items() if v is not None
-        }
-
-    # Serialize to YAML
-    config_yaml = yaml.dump(config, default_flow_style=False, sort_keys=False)
+    config_yaml = base_config + yaml.dump(config, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
     body = client.V1Secret(
         metadata=client.V1ObjectMeta(
@@ -406,7 +753,9 @@ def create_borg_secret(
             labels={
                 "app": "kube-borg-backup",
                 "managed-by": "kube-borg-backup",
-                "ephemeral": "true"
+                "ephemeral": "true",
+                RUN_UID_LABEL: _run_uid,
+                BACKUP_JOB_LABEL: job_id
             }
         ),
         type="Opaque",
@@ -416,18 +765,21 @@ def create_borg_secret(
     )
 
     k8s_api_retry(
-        operation=lambda: v1.create_namespaced_secret(namespace, body),
+        operation=lambda: v1.create_namespaced_secret(namespace, body, _request_timeout=API_REQUEST_TIMEOUT),
         context=f"creating config secret {secret_name}",
-        on_conflict=lambda: v1.read_namespaced_secret(secret_name, namespace),
+        on_conflict=lambda: v1.read_namespaced_secret(
+            secret_name, namespace, _request_timeout=API_REQUEST_TIMEOUT
+        ),
     )
-    _tracked_resources["ssh_secrets"].append(secret_name)
+    track_resource("ssh_secrets", secret_name)
 
 
 def wait_clone_pvc_ready(
     v1: client.CoreV1Api,
     pvc_name: str,
     namespace: str,
-    timeout: int = 300
+    timeout: int = 300,
+    longhorn_grace: int = LONGHORN_GRACE_PERIOD
 ) -> tuple[bool, str]:
     """Wait for clone PVC to be Bound or WaitForFirstConsumer.
 
@@ -435,92 +787,313 @@ def wait_clone_pvc_ready(
     For WaitForFirstConsumer, the PVC won't bind until a pod uses it.
     For Longhorn volumes, additionally waits for workload readiness.
 
+    Reads the PVC once (returning at once if it is already Bound), then watches it from
+    that resourceVersion, so Bound is seen as soon as it happens. The watch runs in short
+    windows so events are still checked while the PVC is Pending.
+
     Args:
         v1: CoreV1Api client
         pvc_name: Name of PVC to wait for
         namespace: Kubernetes namespace
         timeout: Timeout in seconds
+        longhorn_grace: Seconds to wait after a Longhorn volume is ready (0 disables)
 
     Returns:
         Tuple of (success: bool, error_message: str or empty)
     """
     start_time = time.time()
     last_event_check = 0.0
+    resource_version: str | None = None
+    pending = False
+    w = watch.Watch()
 
-    while True:
-        elapsed = int(time.time() - start_time)
-
-        # Check timeout
-        if elapsed >= timeout:
-            # Final event check to surface actual error
-            error_msg = _check_pvc_events_for_errors(v1, pvc_name, namespace)
-            if error_msg:
-                log_msg(f"❌ PVC {pvc_name} provisioning failed: {error_msg}")
-                return False, error_msg
-            log_msg(f"⏰ Timeout waiting for PVC {pvc_name} after {elapsed}s")
-            return False, f"Timeout after {elapsed}s"
-
-        try:
-            # Get PVC status
-            pvc = v1.read_namespaced_persistent_volume_claim(pvc_name, namespace)
-            status = pvc.status.phase
-
-            # Check if Bound
-            if status == "Bound":
-                log_msg(f"✅ PVC {pvc_name} is Bound after {elapsed}s")
-
-                # If PVC is Bound, check if it's Longhorn and wait for workload readiness
-                if is_longhorn_volume(v1, pvc):
-                    log_msg("⏳ Longhorn volume detected, waiting for workload readiness...")
-
-                    # Wait for Longhorn volume to be ready for workload
-                    # Use remaining timeout (same as PVC bind timeout)
-                    remaining_timeout = timeout - elapsed
-                    lh_start = time.time()
-                    while time.time() - lh_start < remaining_timeout:
-                        if is_longhorn_volume_ready(pvc.spec.volume_name):
-                            lh_elapsed = int(time.time() - lh_start)
-                            log_msg(f"✅ Longhorn volume ready (attached+healthy) after {lh_elapsed}s")
-
-                            # Additional wait for Longhorn CSI workload readiness
-                            # Even after state=attached+healthy, CSI needs extra time to make volume
-                            # available for pod attachment (typically 10-15s for cloned volumes)
-                            log_msg("⏳ Waiting additional 15s for Longhorn CSI workload readiness...")
-                            time.sleep(15)
-                            log_msg("✅ Longhorn volume should now be ready for workload attachment")
-                            break
-                        time.sleep(2)
-                    else:
-                        log_msg(f"⚠️  Longhorn volume not ready after {int(time.time() - lh_start)}s, proceeding anyway")
-
-                return True, ""
+    try:
+        while True:
+            elapsed = int(time.time() - start_time)
+
+            # Check timeout
+            if elapsed >= timeout:
+                # Final event check to surface actual error
+                error_msg = _check_pvc_events_for_errors(v1, pvc_name, namespace)
+                if error_msg:
+                    log_msg(f"❌ PVC {pvc_name} provisioning failed: {error_msg}")
+                    return False, error_msg
+                log_msg(f"⏰ Timeout waiting for PVC {pvc_name} after {elapsed}s")
+                return False, f"Timeout after {elapsed}s"
+
+            if resource_version is None:
+                # Fast path for clones that are already Bound, and the version to anchor the watch on
+                try:
+                    pvc = v1.read_namespaced_persistent_volume_claim(
+                        pvc_name, namespace, _request_timeout=API_REQUEST_TIMEOUT
+                    )
+                except WATCH_TRANSPORT_ERRORS as exc:
+                    log_msg(f"⚠️  Could not read PVC {pvc_name} ({exc}) - retrying")
+                    time.sleep(2)
+                    continue
+                resource_version = pvc.metadata.resource_version
+                status = pvc.status.phase if pvc.status else None
+                if status == "Bound":
+                    return _clone_pvc_bound(v1, pvc, int(time.time() - start_time), timeout, longhorn_grace)
+                pending = status == "Pending"
 
             # Check if WaitForFirstConsumer (ready to be used by pod)
-            if status == "Pending":
+            if pending and time.time() - last_event_check >= 10:
                 # Check events every 10 seconds to detect errors early
-                current_time = time.time()
-                if current_time - last_event_check >= 10:
-                    last_event_check = current_time
+                last_event_check = time.time()
+                try:
                     error_msg = _check_pvc_events_for_errors(v1, pvc_name, namespace)
-                    if error_msg:
-                        log_msg(f"❌ PVC {pvc_name} provisioning failed: {error_msg}")
-                        return False, error_msg
-
-                    # Check if WaitForFirstConsumer
-                    events = v1.list_namespaced_event(
-                        namespace,
-                        field_selector=f"involvedObject.name={pvc_name},involvedObject.kind=PersistentVolumeClaim"
-                    )
+                    events = list_pvc_events(v1, pvc_name, namespace)
+                except WATCH_TRANSPORT_ERRORS as exc:
+                    # Events are advisory - keep watching the PVC and check again next round
+                    log_msg(f"⚠️  Could not read events for PVC {pvc_name} ({exc})")
+                    error_msg, events = "", []
+                if error_msg:
+                    log_msg(f"❌ PVC {pvc_name} provisioning failed: {error_msg}")
+                    return False, error_msg
+
+                for ev in events:
+                    if "WaitForFirstConsumer" in ev.message or "waiting for first consumer" in ev.message:
+                        elapsed = int(time.time() - start_time)
+                        log_msg(f"🕓 PVC {pvc_name} waiting for first consumer after {elapsed}s - ready to use")
+                        return True, ""
+
+            bound_pvc = None
+            try:
+                # Watch changes after the last seen version, in windows short enough to recheck events
+                window = max(1, min(10, timeout - int(time.time() - start_time)))
+                for event in w.stream(
+                    v1.list_namespaced_persistent_volume_claim, namespace,
+                    field_selector=f"metadata.name={pvc_name}",
+                    resource_version=resource_version,
+                    timeout_seconds=window
+                ):
+                    pvc = event["object"]
+                    resource_version = pvc.metadata.resource_version
+                    status = pvc.status.phase if pvc.status else None
+
+                    # Check if Bound
+                    if status == "Bound":
+                        bound_pvc = pvc
+                        break
+
+                    pending = status == "Pending"
+                    if pending and time.time() - last_event_check >= 10:
+                        break
+
+            except ApiException as exc:
+                if exc.status == 410:
+                    # Resource version expired - re-read current state on the next window
+                    resource_version = None
+                    continue
+                raise
+            except WATCH_TRANSPORT_ERRORS as exc:
+                # Connection dropped - like a 410, re-read the PVC and re-anchor the watch
+                log_msg(f"⚠️  PVC watch for {pvc_name} interrupted ({exc}) - reconnecting")
+                resource_version = None
+                time.sleep(2)
+                continue
+
+            if bound_pvc is not None:
+                w.stop()
+                return _clone_pvc_bound(
+                    v1, bound_pvc, int(time.time() - start_time), timeout, longhorn_grace
+                )
+
+    except ApiException as exc:
+        log_msg(f"⚠️ Error checking PVC {pvc_name}: {exc}")
+        return False, str(exc)
+
+    finally:
+        w.stop()
+
+
+def _clone_pvc_bound(
+    v1: client.CoreV1Api, pvc: Any, elapsed: int, timeout: int, longhorn_grace: int
+) -> tuple[bool, str]:
+    """Finish waiting for a Bound clone PVC (Longhorn volumes also need workload readiness).
+
+    Args:
+        v1: CoreV1Api client
+        pvc: Bound V1PersistentVolumeClaim
+        elapsed: Seconds spent waiting so far
+        timeout: Overall clone bind timeout in seconds
+        longhorn_grace: Seconds to wait after a Longhorn volume is ready
+
+    Returns:
+        Tuple of (success: bool, error_message: str or empty)
+    """
+    log_msg(f"✅ PVC {pvc.metadata.name} is Bound after {elapsed}s")
+
+    # If PVC is Bound, check if it's Longhorn and wait for workload readiness
+    if is_longhorn_volume(v1, pvc):
+        # Use remaining timeout (same as PVC bind timeout)
+        # Reuse the run's CustomObjectsApi instead of building a wrapper per clone
+        custom_api = _custom_api or client.CustomObjectsApi(v1.api_client)
+        _wait_longhorn_workload_ready(custom_api, pvc.spec.volume_name, timeout - elapsed, longhorn_grace)
+
+    return True, ""
+
+
+def _wait_longhorn_workload_ready(
+    custom_api: client.CustomObjectsApi, pv_name: str, timeout: int, grace: int
+) -> None:
+    """Wait for a bound Longhorn clone volume to become usable by a pod.
+
+    Args:
+        custom_api: CustomObjectsApi client
+        pv_name: PersistentVolume name (same as Longhorn volume name)
+        timeout: Seconds to wait before proceeding anyway
+        grace: Extra seconds to wait once attached+healthy (0 disables)
+    """
+    log_msg("⏳ Longhorn volume detected, waiting for workload readiness...")
+
+    lh_start = time.time()
+    # First read keeps the RBAC and not-found handling; after that, watch the volume CRD
+    try:
+        ready = is_longhorn_volume_ready(custom_api, pv_name)
+    except WATCH_TRANSPORT_ERRORS:
+        ready = False
+    delay = POLL_INITIAL_DELAY
+    w = watch.Watch()
+    try:
+        while not ready and (remaining := timeout - int(time.time() - lh_start)) > 0:
+            try:
+                for event in w.stream(
+                    custom_api.list_namespaced_custom_object,
+                    LONGHORN_GROUP, LONGHORN_VERSION, LONGHORN_NAMESPACE, LONGHORN_PLURAL,
+                    field_selector=f"metadata.name={pv_name}",
+                    timeout_seconds=remaining
+                ):
+                    if longhorn_volume_attached_healthy(event["object"]):
+                        ready = True
+                        break
+            except (ApiException, *WATCH_TRANSPORT_ERRORS):
+                # Watch not permitted, expired or dropped - fall back to polling reads
+                time.sleep(delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER))
+                delay = min(2.0, delay * POLL_BACKOFF)
+                try:
+                    ready = is_longhorn_volume_ready(custom_api, pv_name)
+                except WATCH_TRANSPORT_ERRORS:
+                    ready = False
+    finally:
+        w.stop()
+
+    if not ready:
+        log_msg(f"⚠️  Longhorn volume not ready after {int(time.time() - lh_start)}s, proceeding anyway")
+        return
+
+    lh_elapsed = int(time.time() - lh_start)
+    log_msg(f"✅ Longhorn volume ready (attached+healthy) after {lh_elapsed}s")
+
+    # Additional wait for Longhorn CSI workload readiness
+    # Even after state=attached+healthy, CSI needs extra time to make volume
+    # available for pod attachment (typically 10-15s for cloned volumes)
+    if grace > 0:
+        log_msg(f"⏳ Waiting additional {grace}s for Longhorn CSI workload readiness...")
+        time.sleep(grace)
+        log_msg("✅ Longhorn volume should now be ready for workload attachment")
+
+
+def watch_pvc_events(v1: client.CoreV1Api, namespace: str) -> None:
+    """Keep _pvc_events in sync with all PVC events in the namespace (runs in a daemon thread).
+
+    One LIST followed by a single watch serves every clone waiter, instead of each
+    waiter listing events for its own PVC every 10 seconds.
+
+    Args:
+        v1: CoreV1Api client
+        namespace: Kubernetes namespace
+    """
+    field_selector = "involvedObject.kind=PersistentVolumeClaim"
+    resource_version: str | None = None
+
+    while True:
+        w = watch.Watch()
+        try:
+            if resource_version is None:
+                events = v1.list_namespaced_event(
+                    namespace, field_selector=field_selector, resource_version="0",
+                    _request_timeout=API_REQUEST_TIMEOUT
+                )
+                with _state_lock:
+                    _pvc_events.clear()
                     for event in events.items:
-                        if "WaitForFirstConsumer" in event.message or "waiting for first consumer" in event.message:
-                            log_msg(f"🕓 PVC {pvc_name} waiting for first consumer after {elapsed}s - ready to use")
-                            return True, ""
+                        _pvc_events.setdefault(event.involved_object.name, {})[event.metadata.uid] = event
+                resource_version = events.metadata.resource_version
+
+            # Bounded window, resumed from the last seen version by the next loop iteration
+            _pvc_events_synced.set()
+            for item in w.stream(
+                v1.list_namespaced_event, namespace,
+                field_selector=field_selector,
+                resource_version=resource_version,
+                timeout_seconds=PVC_EVENT_WATCH_WINDOW,
+                _request_timeout=(API_REQUEST_TIMEOUT[0], PVC_EVENT_WATCH_WINDOW + 30)
+            ):
+                event = item["object"]
+                resource_version = event.metadata.resource_version
+                with _state_lock:
+                    by_uid = _pvc_events.setdefault(event.involved_object.name, {})
+                    if item["type"] == "DELETED":
+                        by_uid.pop(event.metadata.uid, None)
+                    else:
+                        by_uid[event.metadata.uid] = event
 
         except ApiException as exc:
-            log_msg(f"⚠️ Error checking PVC {pvc_name}: {exc}")
-            return False, str(exc)
+            # 410 Gone: resource version expired - relist right away
+            _pvc_events_synced.clear()
+            resource_version = None
+            if exc.status != 410:
+                log_msg(f"⚠️  PVC event watch failed ({exc.status}) - falling back to direct reads")
+                time.sleep(5)
+        except WATCH_TRANSPORT_ERRORS as exc:
+            # Dropped or timed-out connection - waiters read directly until the watch resumes
+            # from the last seen version (or relists if that version expired)
+            _pvc_events_synced.clear()
+            log_msg(f"⚠️  PVC event watch interrupted ({exc}) - reconnecting")
+            time.sleep(2)
+        except Exception as exc:
+            _pvc_events_synced.clear()
+            resource_version = None
+            log_msg(f"⚠️  PVC event watch error: {exc}")
+            time.sleep(5)
+        finally:
+            w.stop()
+
+
+def list_pvc_events(v1: client.CoreV1Api, pvc_name: str, namespace: str) -> list[Any]:
+    """Return events for a PVC, from the shared watch cache when it is in sync.
+
+    Args:
+        v1: CoreV1Api client
+        pvc_name: PVC name to get events for
+        namespace: Kubernetes namespace
 
-        time.sleep(5)
+    Returns:
+        List of V1Event objects
+    """
+    if _pvc_events_synced.is_set():
+        with _state_lock:
+            return list(_pvc_events.get(pvc_name, {}).values())
+
+    events = v1.list_namespaced_event(
+        namespace,
+        field_selector=f"involvedObject.name={pvc_name},involvedObject.kind=PersistentVolumeClaim",
+        resource_version="0",  # Watch cache read; events are advisory
+        _request_timeout=API_REQUEST_TIMEOUT
+    )
+    return list(events.items)
+
+
+def _event_timestamp(event: Any) -> datetime:
+    """Return when an event last occurred (lastTimestamp, eventTime or creationTimestamp)."""
+    return (
+        event.last_timestamp
+        or event.event_time
+        or event.metadata.creation_timestamp
+        or datetime.min.replace(tzinfo=UTC)
+    )
 
 
 def _check_pvc_events_for_errors(
@@ -539,26 +1112,13 @@ def _check_pvc_events_for_errors(
         Error message if found, empty string otherwise
     """
     try:
-        events = v1.list_namespaced_event(
-            namespace,
-            field_selector=f"involvedObject.name={pvc_name},involvedObject.kind=PersistentVolumeClaim"
-        )
+        events = list_pvc_events(v1, pvc_name, namespace)
 
-        # Look for error/warning events
-        error_keywords = [
-            "ProvisioningFailed",
-            "not found",
-            "failed",
-            "error",
-            "cannot",
-            "unable"
-        ]
-
-        for event in events.items:
-            if event.type in ["Warning", "Error"]:
-                message = event.message.lower()
-                if any(keyword in message for keyword in error_keywords):
-                    return event.message
+        # Look for error/warning events, newest first. Neither the UID-keyed cache nor LIST order
+        # follows the last occurrence (a repeated event keeps its place), so sort by timestamp.
+        for event in sorted(events, key=_event_timestamp, reverse=True):
+            if event.type in ("Warning", "Error") and PVC_EVENT_ERROR_PATTERN.search(event.message or ""):
+                return event.message
 
         return ""
     except ApiException:
@@ -573,34 +1133,67 @@ def build_borg_pod_manifest(
     config_secret: str,
     cache_pvc: str,
     pvc_timeout: int,
-    namespace: str
+    namespace: str,
+    job_id: str,
+    ephemeral_spec: dict[str, Any] | None = None
 ) -> dict[str, Any]:
     """Build borg pod manifest as pure Python dict.
 
     Args:
         pod_name: Name for the borg pod
         backup_name: Backup identifier (archive prefix)
-        clone_pvc: Name of clone PVC to mount
+        clone_pvc: Name of clone PVC to mount (ignored when ephemeral_spec is set)
         pod_config: Pod configuration (image, resources)
         config_secret: Name of ephemeral secret containing config.yaml
         cache_pvc: Name of borg cache PVC
         pvc_timeout: Per-PVC timeout (pod activeDeadlineSeconds)
         namespace: Kubernetes namespace
+        job_id: Backup job label value
+        ephemeral_spec: Optional clone PVC spec; when set, the snapshot is mounted through a
+            generic ephemeral volume owned by the pod instead of a pre-created clone PVC
 
     Returns:
         Pod manifest as dict
     """
+    # Shared by the pod and its ephemeral clone; manifests are only serialized, never mutated
+    labels = {
+        "app": "kube-borg-backup",
+        "backup": backup_name,
+        "managed-by": "kube-borg-backup",
+        RUN_UID_LABEL: _run_uid,
+        BACKUP_JOB_LABEL: job_id
+    }
+
+    data_volume: dict[str, Any]
+    if ephemeral_spec is not None:
+        # Clone PVC is created by Kubernetes for the pod and garbage collected with it
+        data_volume = {
+            "name": "data",
+            "ephemeral": {
+                "volumeClaimTemplate": {
+                    "metadata": {
+                        "labels": labels
+                    },
+                    "spec": ephemeral_spec
+                }
+            }
+        }
+    else:
+        data_volume = {
+            "name": "data",
+            "persistentVolumeClaim": {
+                "claimName": clone_pvc,
+                "readOnly": True
+            }
+        }
+
     manifest = {
         "apiVersion": "v1",
         "kind": "Pod",
         "metadata": {
             "name": pod_name,
             "namespace": namespace,
-            "labels": {
-                "app": "kube-borg-backup",
-                "backup": backup_name,
-                "managed-by": "kube-borg-backup"
-            }
+            "labels": labels
         },
         "spec": {
             "activeDeadlineSeconds": pvc_timeout,
@@ -616,22 +1209,7 @@ def build_borg_pod_manifest(
                     "securityContext": {
                         "privileged": pod_config.get("privileged", True)
                     },
-                    "volumeMounts": [
-                        {
-                            "name": "config",
-                            "mountPath": "/config",
-                            "readOnly": True
-                        },
-                        {
-                            "name": "data",
-                            "mountPath": "/data",
-                            "readOnly": True
-                        },
-                        {
-                            "name": "cache",
-                            "mountPath": "/cache"
-                        }
-                    ],
+                    "volumeMounts": BORG_VOLUME_MOUNTS,
                     "resources": pod_config.get("resources", {})
                 }
             ],
@@ -642,13 +1220,7 @@ def build_borg_pod_manifest(
                         "secretName": config_secret
                     }
                 },
-                {
-                    "name": "data",
-                    "persistentVolumeClaim": {
-                        "claimName": clone_pvc,
-                        "readOnly": True
-                    }
-                },
+                data_volume,
                 {
                     "name": "cache",
                     "persistentVolumeClaim": {
@@ -683,11 +1255,15 @@ def spawn_borg_pod(
 
     try:
         k8s_api_retry(
-            operation=lambda: v1.create_namespaced_pod(namespace, manifest),
+            operation=lambda: v1.create_namespaced_pod(
+                namespace, manifest, _request_timeout=API_REQUEST_TIMEOUT
+            ),
             context=f"creating borg pod {pod_name}",
-            on_conflict=lambda: v1.read_namespaced_pod(pod_name, namespace),
+            on_conflict=lambda: v1.read_namespaced_pod(
+                pod_name, namespace, _request_timeout=API_REQUEST_TIMEOUT
+            ),
         )
-        _tracked_resources["borg_pods"].append(pod_name)
+        track_resource("borg_pods", pod_name)
     except ApiException as exc:
         log_msg(f"❌ Failed to create borg pod {pod_name}: {exc}")
         return False
@@ -698,30 +1274,71 @@ def spawn_borg_pod(
     monitor = PodMonitor(v1, pod_name, namespace)
     monitor.start()
 
-    # Monitor pod status
+    # Watch pod status until a terminal phase (first window lists current state, later ones resume)
     end = time.time() + timeout
-    while time.time() < end:
-        try:
-            pod = v1.read_namespaced_pod(pod_name, namespace)
-            phase = pod.status.phase
-
-            if phase in {"Succeeded", "Failed"}:
-                # Stop monitoring threads
-                monitor.stop()
-
-                if phase == "Succeeded":
-                    log_msg(f"✅ Borg pod {pod_name} completed successfully")
-                    return True
-                else:
-                    log_msg(f"❌ Borg pod {pod_name} failed")
+    resource_version: str | None = None
+    w = watch.Watch()
+    try:
+        while time.time() < end:
+            stream_kwargs: dict[str, Any] = {
+                "field_selector": f"metadata.name={pod_name}",
+                "timeout_seconds": max(1, min(600, int(end - time.time()))),
+                # Bookmarks advance resource_version while a long backup produces no pod updates,
+                # so reconnects resume instead of hitting 410 on a compacted version and relisting
+                "allow_watch_bookmarks": True,
+            }
+            if resource_version:
+                stream_kwargs["resource_version"] = resource_version
+
+            # A window without resource_version starts with the current state (ADDED if the pod exists)
+            relisted = resource_version is None
+            seen = False
+            try:
+                for event in w.stream(v1.list_namespaced_pod, namespace, **stream_kwargs):
+                    pod = event["object"]
+                    resource_version = pod.metadata.resource_version
+                    if event["type"] == "BOOKMARK":
+                        continue
+                    seen = True
+                    phase = pod.status.phase if pod.status else None
+
+                    if phase in {"Succeeded", "Failed"}:
+                        # Stop monitoring threads
+                        monitor.stop()
+
+                        if phase == "Succeeded":
+                            log_msg(f"✅ Borg pod {pod_name} completed successfully")
+                            return True
+                        else:
+                            log_msg(f"❌ Borg pod {pod_name} failed")
+                            return False
+
+                    if event["type"] == "DELETED":
+                        # Deleted externally (node drain, eviction, manual delete) before finishing
+                        monitor.stop()
+                        log_msg(f"❌ Borg pod {pod_name} was deleted before completing")
+                        return False
+
+                if relisted and not seen:
+                    # Pod vanished while the watch was disconnected
+                    monitor.stop()
+                    log_msg(f"❌ Borg pod {pod_name} no longer exists")
                     return False
 
-        except ApiException as exc:
-            log_msg(f"⚠️  Error reading pod {pod_name}: {exc}")
-            monitor.stop()
-            return False
-
-        time.sleep(10)
+            except ApiException as exc:
+                if exc.status == 410:
+                    # Resource version expired - relist on the next window
+                    resource_version = None
+                    continue
+                log_msg(f"⚠️  Error reading pod {pod_name}: {exc}")
+                monitor.stop()
+                return False
+            except WATCH_TRANSPORT_ERRORS as exc:
+                # Connection dropped mid-window; the pod keeps running, so resume from the last seen version
+                log_msg(f"⚠️  Pod watch for {pod_name} interrupted ({exc}) - reconnecting")
+                time.sleep(2)
+    finally:
+        w.stop()
 
     # Timeout reached
     monitor.stop()
@@ -731,34 +1348,72 @@ def spawn_borg_pod(
 
 def delete_pod(v1: client.CoreV1Api, name: str, namespace: str) -> None:
     """Delete a pod and remove from tracking."""
+    log_msg(f"🗑️  Cleaning up borg pod: {name}")
     try:
-        v1.delete_namespaced_pod(name, namespace)
-        if name in _tracked_resources["borg_pods"]:
-            _tracked_resources["borg_pods"].remove(name)
+        v1.delete_namespaced_pod(name, namespace, body=POD_DELETE_OPTIONS)
+        untrack_resource("borg_pods", name)
     except ApiException:
         pass
 
 
 def delete_pvc(v1: client.CoreV1Api, name: str, namespace: str) -> None:
     """Delete a PVC and remove from tracking."""
+    log_msg(f"🗑️  Cleaning up clone PVC: {name}")
     try:
-        v1.delete_namespaced_persistent_volume_claim(name, namespace)
-        if name in _tracked_resources["clone_pvcs"]:
-            _tracked_resources["clone_pvcs"].remove(name)
+        v1.delete_namespaced_persistent_volume_claim(name, namespace, body=IMMEDIATE_DELETE_OPTIONS)
+        untrack_resource("clone_pvcs", name)
     except ApiException:
         pass
 
 
 def delete_secret(v1: client.CoreV1Api, name: str, namespace: str) -> None:
     """Delete a secret and remove from tracking."""
+    log_msg(f"🗑️  Cleaning up config secret: {name}")
     try:
-        v1.delete_namespaced_secret(name, namespace)
-        if name in _tracked_resources["ssh_secrets"]:
-            _tracked_resources["ssh_secrets"].remove(name)
+        v1.delete_namespaced_secret(name, namespace, body=IMMEDIATE_DELETE_OPTIONS)
+        untrack_resource("ssh_secrets", name)
     except ApiException:
         pass
 
 
+def delete_backup_resources(v1: client.CoreV1Api, job_id: str, owned: dict[str, str], namespace: str) -> None:
+    """Delete the resources of one backup with concurrent label-selected deletes.
+
+    Each kind is removed with one delete_collection call on BACKUP_JOB_LABEL, all kinds at once.
+    Falls back to deleting by name if a collection delete is rejected.
+
+    Args:
+        v1: CoreV1Api client
+        job_id: Backup job label value
+        owned: Tracker kind -> resource name for every resource this backup created
+        namespace: Kubernetes namespace
+    """
+    if not owned:
+        return
+
+    selector = f"{BACKUP_JOB_LABEL}={job_id}"
+    plan = {
+        "ssh_secrets": ("config secret", v1.delete_collection_namespaced_secret,
+                        IMMEDIATE_DELETE_OPTIONS, delete_secret),
+        "borg_pods": ("borg pod", v1.delete_collection_namespaced_pod,
+                      POD_DELETE_OPTIONS, delete_pod),
+        "clone_pvcs": ("clone PVC", v1.delete_collection_namespaced_persistent_volume_claim,
+                       IMMEDIATE_DELETE_OPTIONS, delete_pvc),
+    }
+
+    def delete_kind(kind: str) -> None:
+        name = owned[kind]
+        label, delete_collection, options, delete_one = plan[kind]
+        try:
+            log_msg(f"🗑️  Cleaning up {label}: {name}")
+            delete_collection(namespace, label_selector=selector, body=options)
+            untrack_resource(kind, name)
+        except ApiException:
+            delete_one(v1, name, namespace)
+
+    list(_cleanup_executor.map(delete_kind, list(owned)))
+
+
 def create_single_clone_pvc(
     v1: client.CoreV1Api,
     snap_api: client.CustomObjectsApi,
@@ -802,16 +1457,16 @@ def create_single_clone_pvc(
             failure_reason="Config error - missing required fields"
         )
 
-    # Type narrowing
-    assert isinstance(name, str)
-    assert isinstance(pvc, str)
-    assert isinstance(storage_class, str)
+    # Type narrowing (types validated in load_config)
+    name = cast(str, name)
+    pvc = cast(str, pvc)
+    storage_class = cast(str, storage_class)
 
     try:
         # Find latest snapshot
         log_msg(f"🔍 [{name}] Finding latest snapshot for PVC: {pvc}")
-        snap_name = latest_snapshot(snap_api, pvc, namespace)
-        if not snap_name:
+        snapshot = latest_snapshot(snap_api, pvc, namespace)
+        if not snapshot:
             log_msg(f"❌ [{name}] No ready snapshot found for PVC: {pvc}")
             return ClonePVC(
                 backup_name=name,
@@ -822,6 +1477,7 @@ def create_single_clone_pvc(
                 failed=True,
                 failure_reason="No snapshot found"
             )
+        snap_name, size = snapshot
         log_msg(f"✅ [{name}] Found snapshot: {snap_name}")
 
         # Validate storage class exists
@@ -840,11 +1496,27 @@ def create_single_clone_pvc(
             )
         log_msg(f"✅ [{name}] Storage class validated")
 
+        job_id = uuid.uuid4().hex[:8]
+
+        # Ephemeral mode: the borg pod claims the clone itself, nothing to create up front
+        if backup_config.get("ephemeral", False):
+            log_msg(f"📌 [{name}] Ephemeral mode - snapshot will be mounted via pod-owned ephemeral volume")
+            return ClonePVC(
+                backup_name=name,
+                pvc_name=pvc,
+                clone_name="",
+                snapshot_name=snap_name,
+                backup_config=backup_config,
+                failed=False,
+                ephemeral_spec=build_clone_pvc_spec(snap_name, storage_class, size),
+                job_id=job_id
+            )
+
         # Create clone PVC
         ts = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
         clone_name = f"{snap_name}-clone-{ts}"
         log_msg(f"📦 [{name}] Creating clone PVC: {clone_name}")
-        create_clone_pvc(v1, snap_api, snap_name, clone_name, storage_class, namespace)
+        create_clone_pvc(v1, snap_name, size, clone_name, storage_class, namespace, job_id)
         log_msg(f"✅ [{name}] Clone PVC created")
 
         return ClonePVC(
@@ -853,7 +1525,8 @@ def create_single_clone_pvc(
             clone_name=clone_name,
             snapshot_name=snap_name,
             backup_config=backup_config,
-            failed=False
+            failed=False,
+            job_id=job_id
         )
 
     except Exception as exc:
@@ -869,19 +1542,129 @@ def create_single_clone_pvc(
         )
 
 
+def watch_clone_pvcs(v1: client.CoreV1Api, namespace: str) -> None:
+    """Track the phase of every clone PVC of this run with one watch (runs in a daemon thread).
+
+    Args:
+        v1: CoreV1Api client
+        namespace: Kubernetes namespace
+    """
+    selector = f"{RUN_UID_LABEL}={_run_uid}"
+    resource_version: str | None = None
+
+    while True:
+        w = watch.Watch()
+        try:
+            # First stream lists current state, reconnects resume from the last seen version
+            kwargs = {"resource_version": resource_version} if resource_version else {}
+            for event in w.stream(v1.list_namespaced_persistent_volume_claim, namespace,
+                                  label_selector=selector, **kwargs):
+                pvc = event["object"]
+                resource_version = pvc.metadata.resource_version
+                with _clone_pvcs_changed:
+                    if event["type"] == "DELETED":
+                        _clone_pvc_phases.pop(pvc.metadata.name, None)
+                    else:
+                        _clone_pvc_phases[pvc.metadata.name] = pvc.status.phase if pvc.status else ""
+                    _clone_pvcs_changed.notify_all()
+
+        except ApiException as exc:
+            if exc.status == 410:
+                # Resource version expired - relist right away
+                resource_version = None
+                continue
+            log_msg(f"⚠️  Clone PVC watch failed ({exc.status}) - Phase 2 falls back to creation order")
+            time.sleep(5)
+        except Exception as exc:
+            log_msg(f"⚠️  Clone PVC watch error: {exc}")
+            time.sleep(5)
+        finally:
+            w.stop()
+
+
+def order_clones_by_readiness(clone_pvcs: Iterator[ClonePVC]) -> Iterator[ClonePVC]:
+    """Yield clones for Phase 2, preferring those the shared watch already reports as Bound.
+
+    Clones that failed in Phase 1 or use ephemeral volumes need no wait and are yielded at once.
+    A clone that has waited READY_CLONE_WAIT seconds is taken in creation order even if not Bound,
+    and its own wait_clone_pvc_ready handles WaitForFirstConsumer and provisioning errors.
+
+    Args:
+        clone_pvcs: ClonePVCs in creation-completion order (consumed in a background thread)
+
+    Yields:
+        ClonePVC objects, one at a time
+    """
+    created: list[tuple[ClonePVC, float]] = []
+    feeding = True
+
+    def feed() -> None:
+        nonlocal feeding
+        try:
+            for clone_pvc in clone_pvcs:
+                with _clone_pvcs_changed:
+                    created.append((clone_pvc, time.time()))
+                    _clone_pvcs_changed.notify_all()
+        finally:
+            with _clone_pvcs_changed:
+                feeding = False
+                _clone_pvcs_changed.notify_all()
+
+    threading.Thread(target=feed, name="clone-pvc-feeder", daemon=True).start()
+
+    while True:
+        with _clone_pvcs_changed:
+            while True:
+                pick = next(
+                    (entry for entry in created
+                     if entry[0].failed
+                     or entry[0].ephemeral_spec is not None
+                     or _clone_pvc_phases.get(entry[0].clone_name) == "Bound"),
+                    None
+                )
+                if pick is None and created and time.time() - created[0][1] >= READY_CLONE_WAIT:
+                    pick = created[0]
+                if pick is not None or not (created or feeding):
+                    break
+                wait = READY_CLONE_WAIT - (time.time() - created[0][1]) if created else None
+                _clone_pvcs_changed.wait(timeout=wait)
+
+            if pick is None:
+                return
+            created.remove(pick)
+
+        yield pick[0]
+
+
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Honors the CPU affinity mask (cpusets), unlike os.cpu_count which reports the whole host.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on every platform
+        return os.cpu_count() or 1
+
+
 def create_all_clone_pvcs(
     v1: client.CoreV1Api,
     snap_api: client.CustomObjectsApi,
     storage_api: client.StorageV1Api,
     backups: list[dict[str, Any]],
     namespace: str
-) -> tuple[list[ClonePVC], list[dict[str, Any]]]:
-    """Create clone PVCs in parallel for snapshot-based backups.
+) -> tuple[Iterator[ClonePVC], list[dict[str, Any]]]:
+    """Start clone PVC creation in parallel for snapshot-based backups.
 
     Separates backups into two categories:
     - Snapshot-based (snapshotted=true): creates clone PVCs from snapshots
     - Direct (snapshotted=false): skips clone creation, backs up original PVC
 
+    Clone creation keeps running in the background after this returns. The returned
+    iterator yields each ClonePVC as soon as its creation finishes, so Phase 2 can
+    start the first backup without waiting for the slowest create.
+
     Args:
         v1: CoreV1Api client
         snap_api: CustomObjectsApi client
@@ -890,13 +1673,14 @@ def create_all_clone_pvcs(
         namespace: Kubernetes namespace
 
     Returns:
-        Tuple of (clone_pvcs, direct_pvcs)
+        Tuple of (clone_pvcs in completion order, direct_pvcs)
     """
+    global _clone_executor, _clone_futures
+
     log_msg(f"\n{'='*60}")
     log_msg("📦 Phase 1: Separating snapshot-based and direct backups")
     log_msg(f"{'='*60}")
 
-    clone_pvcs: list[ClonePVC] = []
     direct_pvcs: list[dict[str, Any]] = []
 
     # Separate backups by mode
@@ -909,49 +1693,136 @@ def create_all_clone_pvcs(
             direct_pvcs.append(backup_cfg)
             log_msg(f"📌 [{backup_cfg.get('name')}] Direct mode - will backup original PVC")
 
-    if snapshot_backups:
-        log_msg(f"\n🔄 Creating {len(snapshot_backups)} clone PVC(s) in parallel...")
-        # Create clone PVCs in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=len(snapshot_backups)) as executor:
-            futures = {
-                executor.submit(
-                    create_single_clone_pvc,
-                    v1, snap_api, storage_api, backup_cfg, namespace
-                ): backup_cfg
-                for backup_cfg in snapshot_backups
-            }
-
-            for future in futures:
+    log_msg(f"\n📊 Backup mode summary: {len(snapshot_backups)} snapshot-based, {len(direct_pvcs)} direct")
+
+    if not snapshot_backups:
+        return iter(()), direct_pvcs
+
+    log_msg(f"\n🔄 Creating {len(snapshot_backups)} clone PVC(s) in parallel...")
+    # Create clone PVCs in parallel using ThreadPoolExecutor
+    # Same per-CPU bound as ThreadPoolExecutor's default, capped for apiserver friendliness
+    workers = min(len(snapshot_backups), available_cpus() * 5, MAX_CLONE_WORKERS)
+    log_msg(f"🧵 Using {workers} clone worker thread(s)")
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clone-pvc")
+    futures = [
+        executor.submit(create_single_clone_pvc, v1, snap_api, storage_api, backup_cfg, namespace)
+        for backup_cfg in snapshot_backups
+    ]
+    _clone_executor, _clone_futures = executor, futures
+    log_msg("📝 Note: Clone PVCs will be checked individually before each backup")
+
+    def completed() -> Iterator[ClonePVC]:
+        try:
+            for future in as_completed(futures):
                 clone_pvc = future.result()
-                clone_pvcs.append(clone_pvc)
-
                 if clone_pvc.failed:
                     log_msg(f"❌ [{clone_pvc.backup_name}] Clone creation failed: {clone_pvc.failure_reason}")
-                    _failures.append(f"{clone_pvc.backup_name}: {clone_pvc.failure_reason}")
+                yield clone_pvc
+        finally:
+            executor.shutdown(wait=True)
+
+    return completed(), direct_pvcs
+
+
+def wait_backup_clone_ready(v1: client.CoreV1Api, clone_pvc: ClonePVC, namespace: str) -> tuple[bool, str]:
+    """Wait until a backup's clone PVC can be mounted.
+
+    Failed and ephemeral clones have nothing to wait for and return success;
+    process_backup_with_clone handles failed clones itself.
+
+    Args:
+        v1: CoreV1Api client
+        clone_pvc: ClonePVC from Phase 1
+        namespace: Kubernetes namespace
+
+    Returns:
+        Tuple of (success: bool, error_message: str or empty)
+    """
+    name = clone_pvc.backup_name
+    if clone_pvc.failed or clone_pvc.ephemeral_spec is not None:
+        return True, ""
+
+    clone_bind_timeout = cast(int, clone_pvc.backup_config.get("cloneBindTimeout") or 300)
+    longhorn_grace = clone_pvc.backup_config.get("longhornGracePeriod")
+    if longhorn_grace is None:
+        longhorn_grace = LONGHORN_GRACE_PERIOD
+
+    log_msg(
+        f"⏳ [{name}] Waiting for clone PVC to be ready: {clone_pvc.clone_name} "
+        f"(timeout: {clone_bind_timeout}s)"
+    )
+    try:
+        success, error_msg = wait_clone_pvc_ready(
+            v1, clone_pvc.clone_name, namespace, clone_bind_timeout, longhorn_grace
+        )
+    except Exception as exc:
+        success, error_msg = False, str(exc)
+
+    if not success:
+        log_msg(f"❌ [{name}] Clone PVC not ready: {error_msg}")
+        return False, error_msg
+
+    log_msg(f"✅ [{name}] Clone PVC ready")
+    return True, ""
+
+
+def prefetch_ready_clones(
+    v1: client.CoreV1Api,
+    clone_pvcs: Iterator[ClonePVC],
+    namespace: str
+) -> Iterator[tuple[ClonePVC, tuple[bool, str]]]:
+    """Wait for the next clone while the current backup runs (one-slot lookahead).
+
+    A background thread takes clones in Phase 2 order and waits for each to be ready.
+    It only pulls the next clone once the previous one has been handed out, so it is at
+    most one clone ahead of the backup being processed and the readiness order for later
+    slots is decided as late as possible. Waiting needs no borg lock, so it overlaps safely
+    with the running borg pod.
+
+    Args:
+        v1: CoreV1Api client
+        clone_pvcs: ClonePVCs in Phase 2 order
+        namespace: Kubernetes namespace
 
-        log_msg("✅ All clone PVC creation requests submitted in parallel")
-        log_msg("📝 Note: Clone PVCs will be checked individually before each backup")
+    Yields:
+        Tuples of (clone_pvc, result of wait_backup_clone_ready)
+    """
+    ready: queue.Queue[tuple[ClonePVC, tuple[bool, str]] | None] = queue.Queue(maxsize=1)
+    # Released each time the consumer takes a clone; the worker holds it while preparing the next one
+    slot = threading.Semaphore(1)
 
-    log_msg(f"\n📊 Backup mode summary: {len(clone_pvcs)} snapshot-based, {len(direct_pvcs)} direct")
+    def prepare() -> None:
+        try:
+            while True:
+                slot.acquire()
+                clone_pvc = next(clone_pvcs, None)
+                if clone_pvc is None:
+                    break
+                ready.put((clone_pvc, wait_backup_clone_ready(v1, clone_pvc, namespace)))
+        finally:
+            ready.put(None)
 
-    return clone_pvcs, direct_pvcs
+    threading.Thread(target=prepare, name="clone-lookahead", daemon=True).start()
+
+    while (item := ready.get()) is not None:
+        slot.release()
+        yield item
 
 
 def process_backup_with_clone(
     clone_pvc: ClonePVC,
     v1: client.CoreV1Api,
     release_name: str,
+    run_ts: str,
     pod_config: dict[str, Any],
-    borg_repo: str,
-    borg_passphrase: str,
-    ssh_private_key: str,
+    borg_config: str,
     cache_pvc: str,
-    cache_the_cache: bool,
     borg_flags: list[str],
-    retention: dict[str, int],
     namespace: str,
-    test_mode: bool
-) -> bool:
+    test_mode: bool,
+    test_latency: float = 0.0,
+    clone_ready: tuple[bool, str] | None = None
+) -> str | None:
     """Process a single backup: wait for clone ready, spawn borg pod, cleanup.
 
     This function waits for the specific clone PVC to be ready (allowing
@@ -961,27 +1832,24 @@ def process_backup_with_clone(
         clone_pvc: ClonePVC object with clone details
         v1: CoreV1Api client
         release_name: Helm release fullname for pod naming
+        run_ts: Run timestamp shared by all pod names of this run
         pod_config: Pod configuration
-        borg_repo: Borg repository URL
-        borg_passphrase: Borg passphrase
-        ssh_private_key: SSH private key content
+        borg_config: Run-wide borg config YAML from build_borg_base_config
         cache_pvc: Borg cache PVC name
-        retention: Retention policy
         namespace: Kubernetes namespace
         test_mode: If True, skip borg pod spawn
+        test_latency: Seconds to sleep per backup in test mode
+        clone_ready: Result of wait_backup_clone_ready if already waited for (lookahead)
 
     Returns:
-        True if successful, False if failed
+        Failure message for the final report, or None if the backup succeeded
     """
     name = clone_pvc.backup_name
-    timeout = clone_pvc.backup_config.get("timeout")
+    timeout = cast(int | None, clone_pvc.backup_config.get("timeout"))
 
     if not timeout:
         log_msg(f"❌ [{name}] Backup config missing timeout field")
-        _failures.append(f"{name}: Config error - missing timeout")
-        return False
-
-    assert isinstance(timeout, int)
+        return f"{name}: Config error - missing timeout"
 
     log_msg(f"\n{'='*60}")
     log_msg(f"🔄 Processing backup: {name}")
@@ -990,79 +1858,66 @@ def process_backup_with_clone(
     # Skip if clone failed in Phase 1
     if clone_pvc.failed:
         log_msg(f"⏭️  [{name}] Skipping - clone PVC creation failed in Phase 1")
-        return False
-
-    # Wait for THIS clone PVC to be ready (while other clones provision in background)
-    clone_bind_timeout = clone_pvc.backup_config.get("cloneBindTimeout", 300)
-    assert isinstance(clone_bind_timeout, int)
-
-    log_msg(f"⏳ [{name}] Waiting for clone PVC to be ready: {clone_pvc.clone_name} (timeout: {clone_bind_timeout}s)")
-    success, error_msg = wait_clone_pvc_ready(v1, clone_pvc.clone_name, namespace, clone_bind_timeout)
-
-    if not success:
-        log_msg(f"❌ [{name}] Clone PVC not ready: {error_msg}")
-        _failures.append(f"{name}: Clone PVC bind failed: {error_msg}")
-        return False
+        return f"{name}: {clone_pvc.failure_reason}"
 
-    log_msg(f"✅ [{name}] Clone PVC ready - starting backup")
-
-    pod_name = None
-    config_secret_name = None
-
-    try:
-        # Step 1: Spawn borg pod (or skip in test mode)
-        if test_mode:
-            log_msg(f"🧪 TEST MODE: Skipping borg pod spawn for {name}")
-            log_msg("🧪 TEST MODE: Simulating 2 second backup...")
-            time.sleep(2)
-            log_msg("✅ TEST MODE: Backup simulation successful")
-            return True
+    # Resources are recorded as they come into existence and deleted together on scope exit
+    job_id = clone_pvc.job_id
+    owned: dict[str, str] = {}
+    with contextlib.ExitStack() as stack:
+        stack.callback(delete_backup_resources, v1, job_id, owned, namespace)
+        if clone_pvc.clone_name:
+            owned["clone_pvcs"] = clone_pvc.clone_name
 
-        # Step 1a: Create ephemeral secret with config file
-        ts = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
-        pod_name = f"{release_name}-backup-runner-{name}-{ts}"
-        config_secret_name = f"{pod_name}-config"
-        log_msg(f"🔐 Creating ephemeral config secret: {config_secret_name}")
-        create_borg_secret(
-            v1, config_secret_name,
-            borg_repo, borg_passphrase, ssh_private_key,
-            retention, name, "/data", timeout,
-            cache_the_cache, borg_flags, namespace
-        )
-        log_msg("✅ Config secret created")
-
-        # Step 1b: Build and spawn borg pod
-        log_msg(f"🚀 Spawning borg pod: {pod_name}")
-        manifest = build_borg_pod_manifest(
-            pod_name, name, clone_pvc.clone_name, pod_config,
-            config_secret_name, cache_pvc,
-            timeout, namespace
+        # Wait for THIS clone PVC to be ready, unless the lookahead already did
+        success, error_msg = clone_ready if clone_ready is not None else wait_backup_clone_ready(
+            v1, clone_pvc, namespace
         )
+        if not success:
+            return f"{name}: Clone PVC bind failed: {error_msg}"
 
-        if not spawn_borg_pod(v1, manifest, namespace, timeout):
-            log_msg(f"❌ Borg backup failed for {name}")
-            _failures.append(f"{name}: Borg pod failed")
-            return False
+        try:
+            # Step 1: Spawn borg pod (or skip in test mode)
+            if test_mode:
+                log_msg(f"🧪 TEST MODE: Skipping borg pod spawn for {name}")
+                if test_latency:
+                    log_msg(f"🧪 TEST MODE: Simulating {test_latency:g} second backup...")
+                    time.sleep(test_latency)
+                log_msg("✅ TEST MODE: Backup simulation successful")
+                return None
+
+            # Step 1a: Create ephemeral secret with config file
+            pod_name = f"{release_name}-backup-runner-{name}-{run_ts}"
+            config_secret_name = f"{pod_name}-config"
+            log_msg(f"🔐 Creating ephemeral config secret: {config_secret_name}")
+            create_borg_secret(
+                v1, config_secret_name,
+                borg_config, name, "/data", timeout,
+                borg_flags, namespace, job_id
+            )
+            owned["ssh_secrets"] = config_secret_name
+            log_msg("✅ Config secret created")
+
+            # Step 1b: Build and spawn borg pod
+            log_msg(f"🚀 Spawning borg pod: {pod_name}")
+            manifest = build_borg_pod_manifest(
+                pod_name, name, clone_pvc.clone_name, pod_config,
+                config_secret_name, cache_pvc,
+                timeout, namespace, job_id,
+                ephemeral_spec=clone_pvc.ephemeral_spec
+            )
 
-        log_msg(f"✅ Backup completed for {name}")
-        return True
+            # Recorded before spawning: the pod may exist even if spawn_borg_pod fails
+            owned["borg_pods"] = pod_name
+            if not spawn_borg_pod(v1, manifest, namespace, timeout):
+                log_msg(f"❌ Borg backup failed for {name}")
+                return f"{name}: Borg pod failed"
 
-    except Exception as exc:
-        log_msg(f"❌ Unexpected error during backup {name}: {exc}")
-        _failures.append(f"{name}: {exc}")
-        return False
+            log_msg(f"✅ Backup completed for {name}")
+            return None
 
-    finally:
-        # Always cleanup
-        if config_secret_name:
-            log_msg(f"🗑️  Cleaning up config secret: {config_secret_name}")
-            delete_secret(v1, config_secret_name, namespace)
-        if pod_name:
-            log_msg(f"🗑️  Cleaning up borg pod: {pod_name}")
-            delete_pod(v1, pod_name, namespace)
-        if clone_pvc.clone_name:
-            log_msg(f"🗑️  Cleaning up clone PVC: {clone_pvc.clone_name}")
-            delete_pvc(v1, clone_pvc.clone_name, namespace)
+        except Exception as exc:
+            log_msg(f"❌ Unexpected error during backup {name}: {exc}")
+            return f"{name}: {exc}"
 
 
 def process_direct_backup(
@@ -1072,16 +1927,14 @@ def process_direct_backup(
     borg_flags: list[str],
     v1: client.CoreV1Api,
     release_name: str,
+    run_ts: str,
     pod_config: dict[str, Any],
-    borg_repo: str,
-    borg_passphrase: str,
-    ssh_private_key: str,
+    borg_config: str,
     cache_pvc: str,
-    cache_the_cache: bool,
-    retention: dict[str, int],
     namespace: str,
-    test_mode: bool
-) -> bool:
+    test_mode: bool,
+    test_latency: float = 0.0
+) -> str | None:
     """Process a direct backup: mount original PVC (read-only) and backup.
 
     Args:
@@ -1091,77 +1944,67 @@ def process_direct_backup(
         borg_flags: Borg create flags
         v1: CoreV1Api client
         release_name: Helm release fullname
+        run_ts: Run timestamp shared by all pod names of this run
         pod_config: Pod configuration
-        borg_repo: Borg repository URL
-        borg_passphrase: Borg passphrase
-        ssh_private_key: SSH private key content
+        borg_config: Run-wide borg config YAML from build_borg_base_config
         cache_pvc: Borg cache PVC name
-        cache_the_cache: Enable cache-the-cache
-        retention: Retention policy
         namespace: Kubernetes namespace
         test_mode: If True, skip borg pod spawn
+        test_latency: Seconds to sleep per backup in test mode
 
     Returns:
-        True if successful, False if failed
+        Failure message for the final report, or None if the backup succeeded
     """
     log_msg(f"\n{'='*60}")
     log_msg(f"🔄 Processing DIRECT backup: {name}")
     log_msg(f"{'='*60}")
     log_msg(f"📌 Using original PVC: {pvc} (read-only mount)")
 
-    pod_name = None
-    config_secret_name = None
-
-    try:
-        # Spawn borg pod (or skip in test mode)
-        if test_mode:
-            log_msg(f"🧪 TEST MODE: Skipping borg pod spawn for {name}")
-            log_msg("🧪 TEST MODE: Simulating 2 second backup...")
-            time.sleep(2)
-            log_msg("✅ TEST MODE: Backup simulation successful")
-            return True
-
-        # Create ephemeral secret with config file
-        ts = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
-        pod_name = f"{release_name}-backup-runner-{name}-{ts}"
-        config_secret_name = f"{pod_name}-config"
-        log_msg(f"🔐 Creating ephemeral config secret: {config_secret_name}")
-        create_borg_secret(
-            v1, config_secret_name,
-            borg_repo, borg_passphrase, ssh_private_key,
-            retention, name, "/data", timeout,
-            cache_the_cache, borg_flags, namespace
-        )
-
-        # Build and spawn borg pod with original PVC
-        log_msg(f"🚀 Spawning borg pod: {pod_name}")
-        manifest = build_borg_pod_manifest(
-            pod_name, name, pvc, pod_config,  # Use original PVC instead of clone
-            config_secret_name, cache_pvc,
-            timeout, namespace
-        )
-
-        if not spawn_borg_pod(v1, manifest, namespace, timeout):
-            log_msg(f"❌ Borg backup failed for {name}")
-            _failures.append(f"{name}: Borg pod failed")
-            return False
+    # Resources are deleted together on scope exit (no clone PVC to delete)
+    job_id = uuid.uuid4().hex[:8]
+    owned: dict[str, str] = {}
+    with contextlib.ExitStack() as stack:
+        stack.callback(delete_backup_resources, v1, job_id, owned, namespace)
+        try:
+            # Spawn borg pod (or skip in test mode)
+            if test_mode:
+                log_msg(f"🧪 TEST MODE: Skipping borg pod spawn for {name}")
+                if test_latency:
+                    log_msg(f"🧪 TEST MODE: Simulating {test_latency:g} second backup...")
+                    time.sleep(test_latency)
+                log_msg("✅ TEST MODE: Backup simulation successful")
+                return None
+
+            # Create ephemeral secret with config file
+            pod_name = f"{release_name}-backup-runner-{name}-{run_ts}"
+            config_secret_name = f"{pod_name}-config"
+            log_msg(f"🔐 Creating ephemeral config secret: {config_secret_name}")
+            create_borg_secret(
+                v1, config_secret_name,
+                borg_config, name, "/data", timeout,
+                borg_flags, namespace, job_id
+            )
+            owned["ssh_secrets"] = config_secret_name
+
+            # Build and spawn borg pod with original PVC
+            log_msg(f"🚀 Spawning borg pod: {pod_name}")
+            manifest = build_borg_pod_manifest(
+                pod_name, name, pvc, pod_config,  # Use original PVC instead of clone
+                config_secret_name, cache_pvc,
+                timeout, namespace, job_id
+            )
 
-        log_msg(f"✅ [{name}] Direct backup completed successfully")
-        return True
+            owned["borg_pods"] = pod_name
+            if not spawn_borg_pod(v1, manifest, namespace, timeout):
+                log_msg(f"❌ Borg backup failed for {name}")
+                return f"{name}: Borg pod failed"
 
-    except Exception as exc:
-        log_msg(f"❌ [{name}] Unexpected error during direct backup: {exc}")
-        _failures.append(f"{name}: {exc}")
-        return False
+            log_msg(f"✅ [{name}] Direct backup completed successfully")
+            return None
 
-    finally:
-        # Always cleanup (no clone PVC to delete)
-        if config_secret_name:
-            log_msg(f"🗑️  Cleaning up config secret: {config_secret_name}")
-            delete_secret(v1, config_secret_name, namespace)
-        if pod_name:
-            log_msg(f"🗑️  Cleaning up borg pod: {pod_name}")
-            delete_pod(v1, pod_name, namespace)
+        except Exception as exc:
+            log_msg(f"❌ [{name}] Unexpected error during direct backup: {exc}")
+            return f"{name}: {exc}"
 
 
 def main() -> None:
@@ -1176,7 +2019,7 @@ def main() -> None:
     This maximizes parallelism - first backup starts as soon as first
     clone is ready, even if other clones are still provisioning.
     """
-    global _namespace, _core_api, _storage_api
+    global _namespace, _core_api, _storage_api, _custom_api
 
     # Register SIGTERM handler
     signal.signal(signal.SIGTERM, lambda s, f: cleanup_all_resources())
@@ -1195,8 +2038,10 @@ def main() -> None:
     v1, snap_api, storage_api = init_clients()
     _core_api = v1
     _storage_api = storage_api
+    _custom_api = snap_api
 
     log_msg(f"🔧 Using namespace: {namespace}")
+    log_msg(f"🏷️  Run label: {RUN_UID_LABEL}={_run_uid}")
     if test_mode:
         log_msg("🧪 TEST MODE: Borg pods will NOT be spawned")
 
@@ -1209,16 +2054,22 @@ def main() -> None:
     ssh_private_key = cfg.get("sshPrivateKey")
     cache_pvc = cfg.get("cachePVC", "borg-cache")
     cache_the_cache = cfg.get("cacheTheCache", False)
+    prune_list = cfg.get("pruneList", True)
     retention = cfg.get("retention", {})
 
     if not all([borg_repo, borg_passphrase, ssh_private_key]):
         log_msg("❌ Config missing required fields: borgRepo, borgPassphrase, sshPrivateKey")
         sys.exit(2)
 
-    # Type narrowing: all fields validated as non-None above
-    assert isinstance(borg_repo, str)
-    assert isinstance(borg_passphrase, str)
-    assert isinstance(ssh_private_key, str)
+    # Type narrowing: presence checked above, types validated in load_config
+    borg_repo = cast(str, borg_repo)
+    borg_passphrase = cast(str, borg_passphrase)
+    ssh_private_key = cast(str, ssh_private_key)
+
+    # Backup-invariant part of every config secret, built once
+    borg_config = build_borg_base_config(
+        borg_repo, borg_passphrase, ssh_private_key, retention, cache_the_cache, prune_list
+    )
 
     if not backups:
         log_msg("⚠️  No backups configured")
@@ -1231,25 +2082,41 @@ def main() -> None:
     log_msg(f"📋 Retention: {retention}")
     log_msg("📋 Strategy: Start all clones in parallel → Wait individually per backup")
 
+    # Shared event cache for clone waiters (daemon thread, ends with the process)
+    threading.Thread(target=watch_pvc_events, args=(v1, namespace), daemon=True).start()
+    threading.Thread(target=watch_clone_pvcs, args=(v1, namespace), daemon=True).start()
+
+    preload_storage_classes(storage_api)
+    preload_snapshots(snap_api, namespace)
+
     # Phase 1: Create clone PVCs (snapshot-based) and identify direct backups
     clone_pvcs, direct_pvcs = create_all_clone_pvcs(v1, snap_api, storage_api, backups, namespace)
 
     # Phase 2: Process backups SEQUENTIALLY (borg repo only supports one writer)
+    # One timestamp for all pod names of this run keeps them correlatable in logs
+    run_ts = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
     log_msg(f"\n{'='*60}")
     log_msg("🔄 Phase 2: Processing backups SEQUENTIALLY")
     log_msg(f"{'='*60}")
 
-    # Process snapshot-based backups (with clone PVCs)
-    for clone_pvc in clone_pvcs:
+    # Failure messages for the final report (Phase 1 failures surface via their skipped backup)
+    failures: list[str] = []
+
+    # Process snapshot-based backups (with clone PVCs), whichever clone is ready first,
+    # while the next clone is already being waited for
+    for clone_pvc, clone_ready in prefetch_ready_clones(v1, order_clones_by_readiness(clone_pvcs), namespace):
         # Extract borgFlags from backup config
         borg_flags = clone_pvc.backup_config.get("borgFlags", ["--stats"])
 
-        _ = process_backup_with_clone(  # Result unused, failures tracked in _failures global
-            clone_pvc, v1, release_name, pod_config,
-            borg_repo, borg_passphrase, ssh_private_key, cache_pvc, cache_the_cache,
-            borg_flags, retention, namespace, test_mode
+        failure = process_backup_with_clone(
+            clone_pvc, v1, release_name, run_ts, pod_config,
+            borg_config, cache_pvc,
+            borg_flags, namespace, test_mode, args.test_simulate_latency,
+            clone_ready=clone_ready
         )
         # Continue even on failure (report all failures at end)
+        if failure:
+            failures.append(failure)
 
     # Process direct backups (original PVCs, no clone)
     for direct_backup in direct_pvcs:
@@ -1260,25 +2127,27 @@ def main() -> None:
 
         if not pvc or not timeout:
             log_msg(f"❌ [{name}] Direct backup config missing pvc or timeout")
-            _failures.append(f"{name}: Config error - missing required fields")
+            failures.append(f"{name}: Config error - missing required fields")
             continue
 
-        _ = process_direct_backup(
+        failure = process_direct_backup(
             name, pvc, timeout, borg_flags,
-            v1, release_name, pod_config,
-            borg_repo, borg_passphrase, ssh_private_key, cache_pvc, cache_the_cache,
-            retention, namespace, test_mode
+            v1, release_name, run_ts, pod_config,
+            borg_config, cache_pvc,
+            namespace, test_mode, args.test_simulate_latency
         )
         # Continue even on failure (report all failures at end)
+        if failure:
+            failures.append(failure)
 
     # Report results
     log_msg(f"\n{'='*60}")
     log_msg("📊 Backup Process Complete")
     log_msg(f"{'='*60}")
 
-    if _failures:
-        log_msg(f"\n❌ {len(_failures)} backup(s) failed:")
-        for failure in _failures:
+    if failures:
+        log_msg(f"\n❌ {len(failures)} backup(s) failed:")
+        for failure in failures:
             log_msg(f"  - {failure}")
         log_msg("\n❌ Backup process completed with errors")
         sys.exit(1)